@@ -1,77 +1,64 @@
 # New wall rendering logic to replace lines 2856-2986
 
+from operator import itemgetter
+
+
+# The one room wall direction each view can see, and its projection as
+# f(room_x, room_y, room_width, room_length) -> (depth, SVG x, SVG width)
+ROOM_WALL_EXTRACTORS = {
+    # Looking east from west: depth is the x coordinate, SVG x mapped from y
+    'left': ('west', lambda rx, ry, rw, rl: (rx, ry, rl)),
+    # Looking west from east: depth is -x, SVG x mapped from y
+    'right': ('east', lambda rx, ry, rw, rl: (-(rx + rw), ry, rl)),
+    # Looking south from north: depth is the y coordinate
+    'front': ('north', lambda rx, ry, rw, rl: (ry, rx, rw)),
+    # Looking north from south: depth is -y
+    'back': ('south', lambda rx, ry, rw, rl: (-(ry + rl), rx, rw)),
+}
+
+# Shared stand-in for walls without doors/windows (only ever iterated)
+_NO_OPENINGS = ()
+
+# Element templates with the fixed fill/stroke attributes pre-built (bound
+# .format, filled per element)
+_WALL_RECT = '<rect x="{}" y="{}" width="{}" height="{}" fill="#C19A6B" stroke="#000" stroke-width="0.5"/>\n'.format
+_WALL_POLYGON = '<polygon points="{0},{1} {0},{2} {3},{4} {3},{1}" fill="#C19A6B" stroke="#000" stroke-width="0.5"/>\n'.format
+_OPENING_RECT = '<rect x="{}" y="{}" width="{}" height="{}" fill="{}" stroke="#000" stroke-width="0.5"/>\n'.format
+
 # Step 1: Extract all walls from rooms into a flat array
+visible_direction, extract_room_wall = ROOM_WALL_EXTRACTORS[view_type]
+# Openings are positioned along the axis the view looks across
+room_opening_axis = 'y' if view_type in ('left', 'right') else 'x'
 for depth, priority, obj in floor_objects_with_depth:
     obj_type = obj.get('type')
 
     if obj_type == 'room':
-        room_name = obj.get('name', '')
         walls_list = obj.get('walls', ['north', 'south', 'east', 'west'])
         walls_list = [w.lower() for w in walls_list]
-        wall_heights = obj.get('wall_heights', {})
-        room_x = obj['x']
-        room_y = obj['y']
-        room_width = obj['width']
-        room_length = obj['length']
-
-        # Extract each wall of the room as a separate entity
-        for direction in walls_list:
-            wall_key = f"{room_name}_{direction}"
-            wall_height = wall_heights.get(direction, obj.get('height', floor_height))
-
-            # Calculate wall depth based on view type and direction
-            if view_type == 'left':  # Looking east from west
-                if direction == 'west':  # West walls are visible
-                    walls_to_draw.append({
-                        'type': 'room_wall',
-                        'room_name': room_name,
-                        'direction': direction,
-                        'depth': room_x,  # Depth for left view is x coordinate
-                        'x': room_y,  # SVG x coordinate (mapped from y)
-                        'width': room_length,  # SVG width
-                        'height': wall_height,
-                        'openings': wall_openings.get(wall_key, []),
-                        'opening_coord_getter': lambda dw: dw.get('y', 0)
-                    })
-            elif view_type == 'right':  # Looking west from east
-                if direction == 'east':  # East walls are visible
-                    walls_to_draw.append({
-                        'type': 'room_wall',
-                        'room_name': room_name,
-                        'direction': direction,
-                        'depth': -(room_x + room_width),  # Depth for right view is -x
-                        'x': room_y,  # SVG x coordinate (mapped from y)
-                        'width': room_length,  # SVG width
-                        'height': wall_height,
-                        'openings': wall_openings.get(wall_key, []),
-                        'opening_coord_getter': lambda dw: dw.get('y', 0)
-                    })
-            elif view_type == 'front':  # Looking south from north
-                if direction == 'north':  # North walls are visible
-                    walls_to_draw.append({
-                        'type': 'room_wall',
-                        'room_name': room_name,
-                        'direction': direction,
-                        'depth': room_y,  # Depth for front view is y coordinate
-                        'x': room_x,  # SVG x coordinate
-                        'width': room_width,  # SVG width
-                        'height': wall_height,
-                        'openings': wall_openings.get(wall_key, []),
-                        'opening_coord_getter': lambda dw: dw.get('x', 0)
-                    })
-            elif view_type == 'back':  # Looking north from south
-                if direction == 'south':  # South walls are visible
-                    walls_to_draw.append({
-                        'type': 'room_wall',
-                        'room_name': room_name,
-                        'direction': direction,
-                        'depth': -(room_y + room_length),  # Depth for back view is -y
-                        'x': room_x,  # SVG x coordinate
-                        'width': room_width,  # SVG width
-                        'height': wall_height,
-                        'openings': wall_openings.get(wall_key, []),
-                        'opening_coord_getter': lambda dw: dw.get('x', 0)
-                    })
+
+        # Extract the room's wall facing the viewer (the only one this view sees)
+        if visible_direction in walls_list:
+            room_name = obj.get('name', '')
+            wall_heights = obj.get('wall_heights', {})
+            room_x = obj['x']
+            room_y = obj['y']
+            room_width = obj['width']
+            room_length = obj['length']
+
+            wall_key = f"{room_name}_{visible_direction}"
+            wall_height = wall_heights.get(visible_direction, obj.get('height', floor_height))
+            wall_depth, wall_x, wall_width = extract_room_wall(room_x, room_y, room_width, room_length)
+            walls_to_draw.append({
+                'type': 'room_wall',
+                'room_name': room_name,
+                'direction': visible_direction,
+                'depth': wall_depth,
+                'x': wall_x,  # SVG x coordinate
+                'width': wall_width,  # SVG width
+                'height': wall_height,
+                'openings': wall_openings.get(wall_key, _NO_OPENINGS),
+                'opening_axis': room_opening_axis
+            })
 
     elif obj_type == 'wall':
         wall_name = obj.get('name', '')
@@ -82,13 +69,15 @@ for depth, priority, obj in floor_objects_with_depth:
         wall_height_val = obj.get('height', floor_height)
         wall_height_end = obj.get('height_end', wall_height_val)
 
-        is_horizontal = abs(end_y - start_y) < 1
-        is_vertical = abs(end_x - start_x) < 1
+        dx = end_x - start_x
+        dy = end_y - start_y
+        is_horizontal = -1 < dy < 1
+        is_vertical = -1 < dx < 1
 
         # Only add if visible in this view
         if view_type in ['front', 'back'] and is_horizontal:
-            wall_length = abs(end_x - start_x)
-            wall_pos = min(start_x, end_x)
+            # Length and near end from the signed run along x
+            wall_length, wall_pos = (dx, start_x) if dx >= 0 else (-dx, end_x)
             depth = start_y if view_type == 'front' else -(start_y)
 
             walls_to_draw.append({
@@ -99,12 +88,12 @@ for depth, priority, obj in floor_objects_with_depth:
                 'width': wall_length,
                 'height': wall_height_val,
                 'height_end': wall_height_end,
-                'openings': wall_openings.get(wall_name, []),
-                'opening_coord_getter': lambda dw: dw.get('x', 0)
+                'openings': wall_openings.get(wall_name, _NO_OPENINGS),
+                'opening_axis': 'x'  # Openings are positioned along x
             })
         elif view_type in ['left', 'right'] and is_vertical:
-            wall_length = abs(end_y - start_y)
-            wall_pos = min(start_y, end_y)
+            # Length and near end from the signed run along y
+            wall_length, wall_pos = (dy, start_y) if dy >= 0 else (-dy, end_y)
             depth = start_x if view_type == 'left' else -(start_x)
 
             walls_to_draw.append({
@@ -115,8 +104,8 @@ for depth, priority, obj in floor_objects_with_depth:
                 'width': wall_length,
                 'height': wall_height_val,
                 'height_end': wall_height_end,
-                'openings': wall_openings.get(wall_name, []),
-                'opening_coord_getter': lambda dw: dw.get('y', 0)
+                'openings': wall_openings.get(wall_name, _NO_OPENINGS),
+                'opening_axis': 'y'  # Openings are positioned along y
             })
 
     elif obj_type == 'pillar':
@@ -135,29 +124,36 @@ for depth, priority, obj in floor_objects_with_depth:
             'height': pillar_height
         })
 
-# Step 2: Sort walls by depth (back to front, so deeper/further walls draw first)
-walls_to_draw.sort(key=lambda w: w['depth'])
+# Step 2: Sort walls by depth (back to front, so deeper/further walls draw first).
+# list.sort is stable, so walls at the same depth keep their extraction
+# order - the (depth, priority) order of floor_objects_with_depth.
+walls_to_draw.sort(key=itemgetter('depth'))
 
-# Step 3: Draw each wall with its associated openings
+# Step 3: Draw each wall with its associated openings, collecting the
+# elements and joining them onto svg once
+parts = []
 for wall in walls_to_draw:
+    x = wall['x']
+    width = wall['width']
+    h1 = wall['height']
+    h2 = wall.get('height_end')
+
     # Draw the wall rectangle/polygon
-    if wall.get('height_end') and wall['height'] != wall.get('height_end'):
+    if h2 and h1 != h2:
         # Sloping wall - draw as polygon
-        x = wall['x']
-        width = wall['width']
-        h1 = wall['height']
-        h2 = wall['height_end']
-        svg += f'<polygon points="{x},{current_z} {x},{current_z + h1} {x + width},{current_z + h2} {x + width},{current_z}" fill="#C19A6B" stroke="#000" stroke-width="0.5"/>\n'
+        x_end = x + width
+        parts.append(_WALL_POLYGON(x, current_z, current_z + h1, x_end, current_z + h2))
     else:
         # Regular wall - draw as rectangle
-        svg += f'<rect x="{wall["x"]}" y="{current_z}" width="{wall["width"]}" height="{wall["height"]}" fill="#C19A6B" stroke="#000" stroke-width="0.5"/>\n'
+        parts.append(_WALL_RECT(x, current_z, width, h1))
 
     # Draw openings (doors/windows) for this wall
+    opening_axis = wall['opening_axis']
     for opening in wall['openings']:
         opening_type = opening.get('type')
         opening_width = opening['width']
         opening_height = opening['height']
-        opening_x = wall['opening_coord_getter'](opening)
+        opening_x = opening.get(opening_axis, 0)
 
         if opening_type == 'window':
             sill_height = opening.get('sill_height', 30)
@@ -166,4 +162,6 @@ for wall in walls_to_draw:
             opening_bottom = current_z
 
         fill_color = "#87CEEB" if opening_type == 'window' else "#D2691E"
-        svg += f'<rect x="{opening_x}" y="{opening_bottom}" width="{opening_width}" height="{opening_height}" fill="{fill_color}" stroke="#000" stroke-width="0.5"/>\n'
+        parts.append(_OPENING_RECT(opening_x, opening_bottom, opening_width, opening_height, fill_color))
+
+svg += ''.join(parts)
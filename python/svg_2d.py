@@ -8,7 +8,14 @@ These functions generate SVG drawings for:
 - Dimensions and annotations
 """
 
+import gzip
+import io
+import json
 import math
+import os
+import re
+from collections import defaultdict
+from operator import itemgetter
 from typing import Dict, List, Optional
 
 # Import shared configuration
@@ -597,54 +604,51 @@ def svg_draw_dimension_line(x1: float, y1: float, x2: float, y2: float,
     # Format dimension text
     dim_text = format_dimension(length)
 
-    svg = '<g class="dimension">\n'
+    parts = ['<g class="dimension">\n']
+    append = parts.append
 
     if is_horizontal:
         # Dimension line offset above or below
         dim_y = y1 + offset
 
         # Main dimension line
-        svg += f'  <line x1="{x1}" y1="{dim_y}" x2="{x2}" y2="{dim_y}" stroke="#000" stroke-width="0.5"/>\n'
+        append(f'  <line x1="{x1}" y1="{dim_y}" x2="{x2}" y2="{dim_y}" stroke="#000" stroke-width="0.5"/>\n')
 
         # Extension/witness lines
-        svg += f'  <line x1="{x1}" y1="{y1}" x2="{x1}" y2="{dim_y}" stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n'
-        svg += f'  <line x1="{x2}" y1="{y2}" x2="{x2}" y2="{dim_y}" stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n'
+        append(f'  <line x1="{x1}" y1="{y1}" x2="{x1}" y2="{dim_y}" stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n')
+        append(f'  <line x1="{x2}" y1="{y2}" x2="{x2}" y2="{dim_y}" stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n')
 
-        # Arrowheads
+        # Arrowheads (same shape whether the line sits above or below)
         arrow_size = 3
-        if offset > 0:  # Below
-            svg += f'  <polygon points="{x1},{dim_y} {x1+arrow_size},{dim_y-arrow_size} {x1+arrow_size},{dim_y+arrow_size}" fill="#000"/>\n'
-            svg += f'  <polygon points="{x2},{dim_y} {x2-arrow_size},{dim_y-arrow_size} {x2-arrow_size},{dim_y+arrow_size}" fill="#000"/>\n'
-        else:  # Above
-            svg += f'  <polygon points="{x1},{dim_y} {x1+arrow_size},{dim_y-arrow_size} {x1+arrow_size},{dim_y+arrow_size}" fill="#000"/>\n'
-            svg += f'  <polygon points="{x2},{dim_y} {x2-arrow_size},{dim_y-arrow_size} {x2-arrow_size},{dim_y+arrow_size}" fill="#000"/>\n'
+        append(f'  <polygon points="{x1},{dim_y} {x1+arrow_size},{dim_y-arrow_size} {x1+arrow_size},{dim_y+arrow_size}" fill="#000"/>\n')
+        append(f'  <polygon points="{x2},{dim_y} {x2-arrow_size},{dim_y-arrow_size} {x2-arrow_size},{dim_y+arrow_size}" fill="#000"/>\n')
 
         # Dimension text
         text_y = dim_y - 5 if offset < 0 else dim_y + text_size + 3
-        svg += f'  <text x="{(x1+x2)/2}" y="{text_y}" text-anchor="middle" font-size="{text_size}" fill="#000">{dim_text}</text>\n'
+        append(f'  <text x="{(x1+x2)/2}" y="{text_y}" text-anchor="middle" font-size="{text_size}" fill="#000">{dim_text}</text>\n')
 
     else:  # Vertical
         # Dimension line offset left or right
         dim_x = x1 + offset
 
         # Main dimension line
-        svg += f'  <line x1="{dim_x}" y1="{y1}" x2="{dim_x}" y2="{y2}" stroke="#000" stroke-width="0.5"/>\n'
+        append(f'  <line x1="{dim_x}" y1="{y1}" x2="{dim_x}" y2="{y2}" stroke="#000" stroke-width="0.5"/>\n')
 
         # Extension/witness lines
-        svg += f'  <line x1="{x1}" y1="{y1}" x2="{dim_x}" y2="{y1}" stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n'
-        svg += f'  <line x1="{x2}" y1="{y2}" x2="{dim_x}" y2="{y2}" stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n'
+        append(f'  <line x1="{x1}" y1="{y1}" x2="{dim_x}" y2="{y1}" stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n')
+        append(f'  <line x1="{x2}" y1="{y2}" x2="{dim_x}" y2="{y2}" stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n')
 
         # Arrowheads
         arrow_size = 3
-        svg += f'  <polygon points="{dim_x},{y1} {dim_x-arrow_size},{y1+arrow_size} {dim_x+arrow_size},{y1+arrow_size}" fill="#000"/>\n'
-        svg += f'  <polygon points="{dim_x},{y2} {dim_x-arrow_size},{y2-arrow_size} {dim_x+arrow_size},{y2-arrow_size}" fill="#000"/>\n'
+        append(f'  <polygon points="{dim_x},{y1} {dim_x-arrow_size},{y1+arrow_size} {dim_x+arrow_size},{y1+arrow_size}" fill="#000"/>\n')
+        append(f'  <polygon points="{dim_x},{y2} {dim_x-arrow_size},{y2-arrow_size} {dim_x+arrow_size},{y2-arrow_size}" fill="#000"/>\n')
 
         # Dimension text (rotated for vertical dimensions)
         text_x = dim_x - text_size - 3 if offset < 0 else dim_x + text_size + 3
-        svg += f'  <text x="{text_x}" y="{(y1+y2)/2}" text-anchor="middle" font-size="{text_size}" fill="#000" transform="rotate(-90 {text_x} {(y1+y2)/2})">{dim_text}</text>\n'
+        append(f'  <text x="{text_x}" y="{(y1+y2)/2}" text-anchor="middle" font-size="{text_size}" fill="#000" transform="rotate(-90 {text_x} {(y1+y2)/2})">{dim_text}</text>\n')
 
-    svg += '</g>\n'
-    return svg
+    append('</g>\n')
+    return ''.join(parts)
 
 
 def assign_opening_offset_levels(openings_by_wall: dict) -> dict:
@@ -652,7 +656,8 @@ def assign_opening_offset_levels(openings_by_wall: dict) -> dict:
     Assign offset levels to openings on each wall to prevent overlapping dimensions.
 
     Args:
-        openings_by_wall: Dict mapping wall_name to list of opening dicts with 'x', 'y', 'width', 'direction'
+        openings_by_wall: Dict mapping wall_name to list of opening dicts with 'x', 'y', 'width'
+            and optionally 'direction' (any case, defaults to 'north')
 
     Returns:
         Dictionary mapping (wall_name, opening_index) to offset level
@@ -665,7 +670,7 @@ def assign_opening_offset_levels(openings_by_wall: dict) -> dict:
             continue
 
         # Determine if this is a horizontal or vertical wall
-        direction = openings[0]['direction'].lower()
+        direction = openings[0].get('direction', 'north').lower()
         is_horizontal = direction in ['north', 'south']
 
         # Create pseudo-edges for the openings
@@ -728,6 +733,13 @@ def assign_opening_offset_levels(openings_by_wall: dict) -> dict:
     return opening_levels
 
 
+# Running-dimension fragments shared by the opening dimension emitters.
+# Bound str.format callables; '{}' renders floats exactly like an f-string.
+_OPENING_DIM_LINE = '  <line x1="{}" y1="{}" x2="{}" y2="{}" stroke="#666" stroke-width="0.3"/>\n'.format
+_OPENING_DIM_WITNESS = '  <line x1="{}" y1="{}" x2="{}" y2="{}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'.format
+_OPENING_DIM_ARROW = '  <polygon points="{},{} {},{} {},{}" fill="#666"/>\n'.format
+
+
 def svg_draw_opening_dimensions(x: float, y: float, width: float, direction: str,
                                 wall_start: float, wall_end: float, offset_level: int = 0,
                                 reference_point: float = None) -> str:
@@ -772,14 +784,15 @@ def svg_draw_opening_dimensions(x: float, y: float, width: float, direction: str
             pos_dim_text = format_dimension(pos_length)
 
             # Short dimension line from reference point to opening
-            svg += f'  <line x1="{reference_point}" y1="{pos_dim_y}" x2="{x}" y2="{pos_dim_y}" stroke="#666" stroke-width="0.3"/>\n'
-            svg += f'  <line x1="{reference_point}" y1="{y}" x2="{reference_point}" y2="{pos_dim_y}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'
-            svg += f'  <line x1="{x}" y1="{y}" x2="{x}" y2="{pos_dim_y}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'
+            svg += _OPENING_DIM_LINE(reference_point, pos_dim_y, x, pos_dim_y)
+            svg += _OPENING_DIM_WITNESS(reference_point, y, reference_point, pos_dim_y)
+            svg += _OPENING_DIM_WITNESS(x, y, x, pos_dim_y)
 
             # Small arrows
             arrow_size = 2
-            svg += f'  <polygon points="{reference_point},{pos_dim_y} {reference_point+arrow_size},{pos_dim_y-arrow_size/2} {reference_point+arrow_size},{pos_dim_y+arrow_size/2}" fill="#666"/>\n'
-            svg += f'  <polygon points="{x},{pos_dim_y} {x-arrow_size},{pos_dim_y-arrow_size/2} {x-arrow_size},{pos_dim_y+arrow_size/2}" fill="#666"/>\n'
+            svg += _OPENING_DIM_ARROW(reference_point, pos_dim_y, reference_point+arrow_size, pos_dim_y-arrow_size/2,
+                                      reference_point+arrow_size, pos_dim_y+arrow_size/2)
+            svg += _OPENING_DIM_ARROW(x, pos_dim_y, x-arrow_size, pos_dim_y-arrow_size/2, x-arrow_size, pos_dim_y+arrow_size/2)
 
             # Text
             text_y = pos_dim_y - 3 if direction == 'north' else pos_dim_y + text_size + 1
@@ -810,13 +823,14 @@ def svg_draw_opening_dimensions(x: float, y: float, width: float, direction: str
             pos_length = abs(y - reference_point)
             pos_dim_text = format_dimension(pos_length)
 
-            svg += f'  <line x1="{pos_dim_x}" y1="{reference_point}" x2="{pos_dim_x}" y2="{y}" stroke="#666" stroke-width="0.3"/>\n'
-            svg += f'  <line x1="{x}" y1="{reference_point}" x2="{pos_dim_x}" y2="{reference_point}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'
-            svg += f'  <line x1="{x}" y1="{y}" x2="{pos_dim_x}" y2="{y}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'
+            svg += _OPENING_DIM_LINE(pos_dim_x, reference_point, pos_dim_x, y)
+            svg += _OPENING_DIM_WITNESS(x, reference_point, pos_dim_x, reference_point)
+            svg += _OPENING_DIM_WITNESS(x, y, pos_dim_x, y)
 
             arrow_size = 2
-            svg += f'  <polygon points="{pos_dim_x},{reference_point} {pos_dim_x-arrow_size/2},{reference_point+arrow_size} {pos_dim_x+arrow_size/2},{reference_point+arrow_size}" fill="#666"/>\n'
-            svg += f'  <polygon points="{pos_dim_x},{y} {pos_dim_x-arrow_size/2},{y-arrow_size} {pos_dim_x+arrow_size/2},{y-arrow_size}" fill="#666"/>\n'
+            svg += _OPENING_DIM_ARROW(pos_dim_x, reference_point, pos_dim_x-arrow_size/2, reference_point+arrow_size,
+                                      pos_dim_x+arrow_size/2, reference_point+arrow_size)
+            svg += _OPENING_DIM_ARROW(pos_dim_x, y, pos_dim_x-arrow_size/2, y-arrow_size, pos_dim_x+arrow_size/2, y-arrow_size)
 
             text_x = pos_dim_x - text_size - 2 if direction == 'west' else pos_dim_x + text_size + 2
             svg += f'  <text x="{text_x}" y="{(reference_point+y)/2}" text-anchor="middle" font-size="{text_size}" fill="#666" transform="rotate(-90 {text_x} {(reference_point+y)/2})">{pos_dim_text}</text>\n'
@@ -841,46 +855,143 @@ def svg_draw_opening_dimensions(x: float, y: float, width: float, direction: str
     return svg
 
 
-def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
-                            scale: float = 2.0) -> str:
+def _svg_final_opening_dimension(start: float, end: float, cross: float, offset: float,
+                                 direction: str, text_size: float) -> str:
     """
-    Generate an SVG floor plan from a floor configuration.
+    Draw the closing running dimension from the last opening to the wall's inside edge.
+
+    Coordinates are given along the wall axis so one emitter serves both
+    horizontal (north/south) and vertical (east/west) walls.
+
+    Args:
+        start: End of the last opening along the wall
+        end: Inside edge of the wall along the wall
+        cross: Last opening's coordinate across the wall (y for N/S, x for E/W)
+        offset: Unsigned distance of the dimension line from the opening
+        direction: Wall direction ('north', 'south', 'east', 'west')
+        text_size: Font size for the dimension text
+
+    Returns:
+        SVG string
+    """
+    is_horizontal = direction in ['north', 'south']
+    dim_cross = cross + (-offset if direction in ['north', 'west'] else offset)
+
+    # Map (along, across) wall coordinates onto (x, y)
+    if is_horizontal:
+        def pt(along, across):
+            return along, across
+    else:
+        def pt(along, across):
+            return across, along
+
+    arrow_size = 2
+    half_arrow = arrow_size / 2
+    mid = (start + end) / 2
+
+    svg = '<g class="opening-dimension">\n'
+    svg += _OPENING_DIM_LINE(*pt(start, dim_cross), *pt(end, dim_cross))
+    svg += _OPENING_DIM_WITNESS(*pt(start, cross), *pt(start, dim_cross))
+    svg += _OPENING_DIM_WITNESS(*pt(end, cross), *pt(end, dim_cross))
+
+    svg += _OPENING_DIM_ARROW(*pt(start, dim_cross), *pt(start + arrow_size, dim_cross - half_arrow),
+                              *pt(start + arrow_size, dim_cross + half_arrow))
+    svg += _OPENING_DIM_ARROW(*pt(end, dim_cross), *pt(end - arrow_size, dim_cross - half_arrow),
+                              *pt(end - arrow_size, dim_cross + half_arrow))
+
+    dim_text = format_dimension(end - start)
+    if is_horizontal:
+        text_y = dim_cross - 3 if direction == 'north' else dim_cross + text_size + 1
+        svg += f'  <text x="{mid}" y="{text_y}" text-anchor="middle" font-size="{text_size}" fill="#666">{dim_text}</text>\n'
+    else:
+        text_x = dim_cross - text_size - 2 if direction == 'west' else dim_cross + text_size + 2
+        svg += f'  <text x="{text_x}" y="{mid}" text-anchor="middle" font-size="{text_size}" fill="#666" transform="rotate(-90 {text_x} {mid})">{dim_text}</text>\n'
+
+    svg += '</g>\n'
+    return svg
+
+
+def _drawing_info(translate_x: float, translate_y: float, svg_width: float,
+                  svg_height: float, content_start: int, content_end: int) -> dict:
+    """
+    Describe where a rendered floor plan / elevation keeps its drawing, so
+    the combined sheets can lift it out without re-parsing the SVG.
+
+    content_start/content_end bound the drawing group's inner content in
+    the SVG string (just after its opening tag, up to its closing </g>).
+    """
+    return {
+        'translate_x': translate_x,
+        'translate_y': translate_y,
+        'svg_width': svg_width,
+        'svg_height': svg_height,
+        'content_start': content_start,
+        'content_end': content_end,
+    }
+
+
+def _render_floor_plan(floor_config: dict, scale: float = 2.0) -> tuple:
+    """
+    Render a floor plan SVG document.
 
     Args:
         floor_config: Floor configuration dictionary
-        output_path: Path to save SVG file (if None, returns SVG string only)
-        scale: Pixels per unit (default: 2 pixels per unit)
+        scale: Pixels per unit
 
     Returns:
-        SVG content as string
+        (svg, drawing) - the SVG string and a dict locating its drawing
+        group (see _drawing_info), or ('', None) for a floor with nothing
+        to plan
     """
     floor_num = floor_config.get('floor_number', 0)
     floor_name = floor_config.get('name', f'Floor {floor_num}')
 
+    # Classify every object once; each section below reads its bucket
+    # instead of re-scanning floor_config['objects'] behind a type guard.
+    # Rooms/walls and doors/windows also keep a combined list because
+    # their SVG is emitted interleaved in config order. Door/window
+    # directions are lower-cased once into a parallel list rather than
+    # stored on the config dicts, which are shared with other generators.
+    by_type = {
+        'floor_slab': [], 'beam': [], 'staircase': [], 'room': [],
+        'wall': [], 'pillar': [], 'door': [], 'window': [],
+    }
+    rooms_and_walls = []
+    doors_and_windows = []
+    opening_dirs = []
+    for obj in floor_config.get('objects', []):
+        obj_type = obj.get('type')
+        bucket = by_type.get(obj_type)
+        if bucket is None:
+            continue
+        bucket.append(obj)
+        if obj_type == 'room' or obj_type == 'wall':
+            rooms_and_walls.append(obj)
+        elif obj_type == 'door' or obj_type == 'window':
+            doors_and_windows.append(obj)
+            opening_dirs.append(obj.get('direction', 'north').lower())
+
     # Find bounds
     min_x, min_y = float('inf'), float('inf')
     max_x, max_y = float('-inf'), float('-inf')
 
-    if 'objects' in floor_config:
-        for obj in floor_config['objects']:
-            obj_type = obj.get('type')
+    for obj_type in ('floor_slab', 'beam', 'room'):
+        for obj in by_type[obj_type]:
+            x, y = obj['x'], obj['y']
+            w, l = obj['width'], obj['length']
+            min_x, min_y = min(min_x, x), min(min_y, y)
+            max_x, max_y = max(max_x, x + w), max(max_y, y + l)
 
-            if obj_type in ['floor_slab', 'beam', 'room']:
-                x, y = obj['x'], obj['y']
-                w, l = obj['width'], obj['length']
-                min_x, min_y = min(min_x, x), min(min_y, y)
-                max_x, max_y = max(max_x, x + w), max(max_y, y + l)
-
-            elif obj_type == 'wall':
-                min_x = min(min_x, obj['start_x'], obj['end_x'])
-                max_x = max(max_x, obj['start_x'], obj['end_x'])
-                min_y = min(min_y, obj['start_y'], obj['end_y'])
-                max_y = max(max_y, obj['start_y'], obj['end_y'])
+    for obj in by_type['wall']:
+        min_x = min(min_x, obj['start_x'], obj['end_x'])
+        max_x = max(max_x, obj['start_x'], obj['end_x'])
+        min_y = min(min_y, obj['start_y'], obj['end_y'])
+        max_y = max(max_y, obj['start_y'], obj['end_y'])
 
     # No bounded 2-D objects on this floor (e.g. loft floor whose only
     # object is the hip_roof) — nothing to plan.
     if min_x == float('inf') or max_x == float('-inf'):
-        return ''
+        return '', None
 
     # Add margin (extra at top for title and dimensions)
     dim_config = GLOBAL_CONFIG['dimensions']
@@ -900,8 +1011,13 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
     width = (max_x - min_x) * scale + 2 * margin
     height = (max_y - min_y) * scale + margin + top_margin
 
-    # Start SVG
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+    # Start SVG (the canvas size is kept aside - width/height are reused below)
+    svg_width, svg_height = width, height
+    translate_x = margin - min_x * scale
+    translate_y = top_margin - min_y * scale
+    buf = io.StringIO()
+    write = buf.write
+    write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
 <title>{floor_name} - Floor Plan</title>
 <defs>
@@ -909,131 +1025,104 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
         text {{ font-family: Arial, sans-serif; }}
     </style>
 </defs>
-<g transform="translate({margin - min_x * scale}, {top_margin - min_y * scale}) scale({scale}, {scale})">
-
-'''
+<g transform="translate({translate_x}, {translate_y}) scale({scale}, {scale})">''')
+    content_start = buf.tell()
+    write('\n\n')
 
     # Draw floor slabs first (lowest layer)
-    if 'objects' in floor_config:
-        for obj in floor_config['objects']:
-            if obj.get('type') == 'floor_slab':
-                svg += svg_draw_floor_slab(obj['x'], obj['y'], obj['width'], obj['length'])
+    for obj in by_type['floor_slab']:
+        write(svg_draw_floor_slab(obj['x'], obj['y'], obj['width'], obj['length']))
 
     # Draw beams next (above floor slabs)
-    if 'objects' in floor_config:
-        for obj in floor_config['objects']:
-            if obj.get('type') == 'beam':
-                svg += svg_draw_beam(obj['x'], obj['y'], obj['width'], obj['length'])
+    for obj in by_type['beam']:
+        write(svg_draw_beam(obj['x'], obj['y'], obj['width'], obj['length']))
 
     # Draw staircases (after beams, before walls)
-    if 'objects' in floor_config:
-        for obj in floor_config['objects']:
-            if obj.get('type') == 'staircase':
-                # Handle both old format (x, y, width, length) and new format (start_x, start_y, step_width, step_tread, direction)
-                if 'start_x' in obj:
-                    # New format with compass direction
-                    start_x = obj['start_x']
-                    start_y = obj['start_y']
-                    step_width = obj.get('step_width', 30)
-                    step_tread = obj.get('step_tread', 10)
-                    num_steps = obj.get('num_steps', 10)
-                    compass_dir = obj.get('direction', 'north')
-
-                    # Convert compass direction to x, y, width, length, and arrow direction
-                    # North = upward (decreasing Y), South = downward (increasing Y)
-                    if compass_dir == 'north':
-                        x, y = start_x, start_y - num_steps * step_tread
-                        width, length = step_width, num_steps * step_tread
-                        arrow_dir = 'up'
-                    elif compass_dir == 'south':
-                        x, y = start_x, start_y
-                        width, length = step_width, num_steps * step_tread
-                        arrow_dir = 'down'
-                    elif compass_dir == 'east':
-                        x, y = start_x, start_y
-                        width, length = num_steps * step_tread, step_width
-                        arrow_dir = 'up'
-                    elif compass_dir == 'west':
-                        x, y = start_x - num_steps * step_tread, start_y
-                        width, length = num_steps * step_tread, step_width
-                        arrow_dir = 'down'
-                else:
-                    # Old format
-                    x = obj['x']
-                    y = obj['y']
-                    width = obj['width']
-                    length = obj['length']
-                    arrow_dir = obj.get('direction', 'up')
-                    num_steps = obj.get('num_steps')
-
-                svg += svg_draw_staircase(x, y, width, length, arrow_dir, num_steps)
+    for obj in by_type['staircase']:
+        # Handle both old format (x, y, width, length) and new format (start_x, start_y, step_width, step_tread, direction)
+        if 'start_x' in obj:
+            # New format with compass direction
+            start_x = obj['start_x']
+            start_y = obj['start_y']
+            step_width = obj.get('step_width', 30)
+            step_tread = obj.get('step_tread', 10)
+            num_steps = obj.get('num_steps', 10)
+            compass_dir = obj.get('direction', 'north')
+
+            # Convert compass direction to x, y, width, length, and arrow direction
+            # North = upward (decreasing Y), South = downward (increasing Y)
+            if compass_dir == 'north':
+                x, y = start_x, start_y - num_steps * step_tread
+                width, length = step_width, num_steps * step_tread
+                arrow_dir = 'up'
+            elif compass_dir == 'south':
+                x, y = start_x, start_y
+                width, length = step_width, num_steps * step_tread
+                arrow_dir = 'down'
+            elif compass_dir == 'east':
+                x, y = start_x, start_y
+                width, length = num_steps * step_tread, step_width
+                arrow_dir = 'up'
+            elif compass_dir == 'west':
+                x, y = start_x - num_steps * step_tread, start_y
+                width, length = num_steps * step_tread, step_width
+                arrow_dir = 'down'
+        else:
+            # Old format
+            x = obj['x']
+            y = obj['y']
+            width = obj['width']
+            length = obj['length']
+            arrow_dir = obj.get('direction', 'up')
+            num_steps = obj.get('num_steps')
 
-    # Store pillar data to draw them last
-    pillars_to_draw = []
+        write(svg_draw_staircase(x, y, width, length, arrow_dir, num_steps))
 
-    # Draw walls and rooms
+    # Draw walls and rooms (pillars are drawn last, after all dimensions)
     wall_thickness = GLOBAL_CONFIG.get('wall_thickness', 8)
 
-    if 'objects' in floor_config:
-        for obj in floor_config['objects']:
-            obj_type = obj.get('type')
+    for obj in rooms_and_walls:
+        if obj['type'] == 'room':
+            write(svg_draw_room(
+                obj['x'], obj['y'],
+                obj['width'], obj['length'],
+                obj.get('wall_thickness', wall_thickness),
+                obj.get('name', ''),
+                obj.get('walls')
+            ))
 
-            if obj_type == 'room':
-                svg += svg_draw_room(
-                    obj['x'], obj['y'],
-                    obj['width'], obj['length'],
-                    obj.get('wall_thickness', wall_thickness),
-                    obj.get('name', ''),
-                    obj.get('walls')
-                )
-
-            elif obj_type == 'wall':
-                thickness = obj.get('thickness', wall_thickness)
-                svg += svg_draw_wall(
-                    obj['start_x'], obj['start_y'],
-                    obj['end_x'], obj['end_y'],
-                    thickness
-                )
-
-            elif obj_type == 'pillar':
-                # Store pillar data for drawing later (after all walls and dimensions)
-                pillars_to_draw.append({
-                    'x': obj['x'],
-                    'y': obj['y'],
-                    'size': obj.get('size'),
-                    'width': obj.get('width'),
-                    'length': obj.get('length')
-                })
+        else:
+            thickness = obj.get('thickness', wall_thickness)
+            write(svg_draw_wall(
+                obj['start_x'], obj['start_y'],
+                obj['end_x'], obj['end_y'],
+                thickness
+            ))
 
     # Draw doors and windows
-    if 'objects' in floor_config:
-        for obj in floor_config['objects']:
-            obj_type = obj.get('type')
+    for obj, direction in zip(doors_and_windows, opening_dirs):
+        if obj['type'] == 'door':
+            write(svg_draw_door(
+                obj['x'], obj['y'],
+                obj['width'],
+                direction
+            ))
 
-            if obj_type == 'door':
-                svg += svg_draw_door(
-                    obj['x'], obj['y'],
-                    obj['width'],
-                    obj.get('direction', 'north')
-                )
-
-            elif obj_type == 'window':
-                svg += svg_draw_window(
-                    obj['x'], obj['y'],
-                    obj['width'],
-                    obj.get('direction', 'north')
-                )
+        else:
+            write(svg_draw_window(
+                obj['x'], obj['y'],
+                obj['width'],
+                direction
+            ))
 
     # Add dimensions
-    dim_config = GLOBAL_CONFIG['dimensions']
-
     # Draw door/window dimensions
-    if dim_config['show_opening_dimensions'] and 'objects' in floor_config:
+    if dim_config['show_opening_dimensions']:
         # First, create a map of wall names to their bounds
         wall_bounds = {}
 
-        for obj in floor_config['objects']:
-            if obj.get('type') == 'room':
+        for obj in rooms_and_walls:
+            if obj['type'] == 'room':
                 room_name = obj['name']
                 x, y = obj['x'], obj['y']
                 w, h = obj['width'], obj['length']
@@ -1043,7 +1132,7 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
                 wall_bounds[f"{room_name}_East"] = {'start': y, 'end': y + h, 'coord': x + w, 'direction': 'east'}
                 wall_bounds[f"{room_name}_West"] = {'start': y, 'end': y + h, 'coord': x, 'direction': 'west'}
 
-            elif obj.get('type') == 'wall':
+            else:
                 wall_name = obj.get('name', 'Wall')
                 x1, y1 = obj['start_x'], obj['start_y']
                 x2, y2 = obj['end_x'], obj['end_y']
@@ -1058,22 +1147,18 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
         # Group openings by wall and collect them
         openings_by_wall = {}
 
-        for obj in floor_config['objects']:
-            obj_type = obj.get('type')
+        for obj, direction in zip(doors_and_windows, opening_dirs):
+            room = obj.get('room')
+            wall_name = obj.get('wall')
 
-            if obj_type in ['door', 'window']:
-                direction = obj.get('direction', 'north').lower()
-                room = obj.get('room')
-                wall_name = obj.get('wall')
+            if room and not wall_name:
+                wall_name = f"{room}_{direction.capitalize()}"
 
-                if room and not wall_name:
-                    wall_name = f"{room}_{direction.capitalize()}"
+            if wall_name and wall_name in wall_bounds:
+                if wall_name not in openings_by_wall:
+                    openings_by_wall[wall_name] = []
 
-                if wall_name and wall_name in wall_bounds:
-                    if wall_name not in openings_by_wall:
-                        openings_by_wall[wall_name] = []
-
-                    openings_by_wall[wall_name].append(obj)
+                openings_by_wall[wall_name].append(obj)
 
         # Sort openings on each wall by position
         for wall_name, openings in openings_by_wall.items():
@@ -1087,100 +1172,54 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
                 openings.sort(key=lambda o: o['y'])
 
         # Assign offset levels to prevent overlapping dimensions
-        # Convert to the format expected by assign_opening_offset_levels
-        openings_for_levels = {}
-        for wall_name, openings in openings_by_wall.items():
-            openings_for_levels[wall_name] = [
-                {'x': o['x'], 'y': o['y'], 'width': o['width'], 'direction': o.get('direction', 'north').lower()}
-                for o in openings
-            ]
-        opening_levels = assign_opening_offset_levels(openings_for_levels)
+        # (the sorted door/window dicts are passed through as-is)
+        opening_levels = assign_opening_offset_levels(openings_by_wall)
 
         # Draw dimensions for doors and windows with running dimensions
-        wall_thickness = GLOBAL_CONFIG.get('wall_thickness', 8)
         opening_offset = dim_config['opening_dimension_offset']
         opening_text_size = dim_config['opening_text_size']
 
         for wall_name, openings in openings_by_wall.items():
             wall_info = wall_bounds[wall_name]
             direction = wall_info['direction']
+            wall_start = wall_info['start']
+            wall_end = wall_info['end']
+
+            # Running dimensions advance along X on horizontal (N/S) walls
+            # and along Y on vertical (E/W) walls
+            axis = 'x' if direction in ['north', 'south'] else 'y'
 
             # Start from inside edge of wall (add wall thickness)
-            if direction in ['north', 'south']:
-                # Horizontal walls - offset along X axis
-                reference_point = wall_info['start'] + wall_thickness
-            else:
-                # Vertical walls - offset along Y axis
-                reference_point = wall_info['start'] + wall_thickness
+            reference_point = wall_start + wall_thickness
 
             for wall_index, obj in enumerate(openings):
                 offset_level = opening_levels.get((wall_name, wall_index), 0)
 
-                svg += svg_draw_opening_dimensions(
+                write(svg_draw_opening_dimensions(
                     obj['x'], obj['y'],
                     obj['width'],
                     direction,
-                    wall_info['start'],
-                    wall_info['end'],
+                    wall_start,
+                    wall_end,
                     offset_level,
                     reference_point
-                )
+                ))
 
                 # Update reference point to end of this opening for next opening
-                if direction in ['north', 'south']:
-                    reference_point = obj['x'] + obj['width']
-                else:
-                    reference_point = obj['y'] + obj['width']
+                reference_point = obj[axis] + obj['width']
 
             # Add final dimension from last opening to inside edge of wall
             if openings:
                 last_opening = openings[-1]
-                wall_inside_end = wall_info['end'] - wall_thickness
-
-                # Calculate the final span
-                if direction in ['north', 'south']:
-                    final_start = last_opening['x'] + last_opening['width']
-                    final_length = wall_inside_end - final_start
-
-                    if final_length > 5:  # Only show if meaningful distance
-                        position_offset = -opening_offset if direction == 'north' else opening_offset
-                        pos_dim_y = last_opening['y'] + position_offset
-                        final_dim_text = format_dimension(final_length)
-
-                        svg += '<g class="opening-dimension">\n'
-                        svg += f'  <line x1="{final_start}" y1="{pos_dim_y}" x2="{wall_inside_end}" y2="{pos_dim_y}" stroke="#666" stroke-width="0.3"/>\n'
-                        svg += f'  <line x1="{final_start}" y1="{last_opening["y"]}" x2="{final_start}" y2="{pos_dim_y}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'
-                        svg += f'  <line x1="{wall_inside_end}" y1="{last_opening["y"]}" x2="{wall_inside_end}" y2="{pos_dim_y}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'
-
-                        arrow_size = 2
-                        svg += f'  <polygon points="{final_start},{pos_dim_y} {final_start+arrow_size},{pos_dim_y-arrow_size/2} {final_start+arrow_size},{pos_dim_y+arrow_size/2}" fill="#666"/>\n'
-                        svg += f'  <polygon points="{wall_inside_end},{pos_dim_y} {wall_inside_end-arrow_size},{pos_dim_y-arrow_size/2} {wall_inside_end-arrow_size},{pos_dim_y+arrow_size/2}" fill="#666"/>\n'
-
-                        text_y = pos_dim_y - 3 if direction == 'north' else pos_dim_y + opening_text_size + 1
-                        svg += f'  <text x="{(final_start+wall_inside_end)/2}" y="{text_y}" text-anchor="middle" font-size="{opening_text_size}" fill="#666">{final_dim_text}</text>\n'
-                        svg += '</g>\n'
-
-                else:  # Vertical wall (east/west)
-                    final_start = last_opening['y'] + last_opening['width']
-                    final_length = wall_inside_end - final_start
-
-                    if final_length > 5:  # Only show if meaningful distance
-                        position_offset = -opening_offset if direction == 'west' else opening_offset
-                        pos_dim_x = last_opening['x'] + position_offset
-                        final_dim_text = format_dimension(final_length)
-
-                        svg += '<g class="opening-dimension">\n'
-                        svg += f'  <line x1="{pos_dim_x}" y1="{final_start}" x2="{pos_dim_x}" y2="{wall_inside_end}" stroke="#666" stroke-width="0.3"/>\n'
-                        svg += f'  <line x1="{last_opening["x"]}" y1="{final_start}" x2="{pos_dim_x}" y2="{final_start}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'
-                        svg += f'  <line x1="{last_opening["x"]}" y1="{wall_inside_end}" x2="{pos_dim_x}" y2="{wall_inside_end}" stroke="#666" stroke-width="0.2" stroke-dasharray="1,1"/>\n'
+                wall_inside_end = wall_end - wall_thickness
+                final_start = last_opening[axis] + last_opening['width']
 
-                        arrow_size = 2
-                        svg += f'  <polygon points="{pos_dim_x},{final_start} {pos_dim_x-arrow_size/2},{final_start+arrow_size} {pos_dim_x+arrow_size/2},{final_start+arrow_size}" fill="#666"/>\n'
-                        svg += f'  <polygon points="{pos_dim_x},{wall_inside_end} {pos_dim_x-arrow_size/2},{wall_inside_end-arrow_size} {pos_dim_x+arrow_size/2},{wall_inside_end-arrow_size}" fill="#666"/>\n'
-
-                        text_x = pos_dim_x - opening_text_size - 2 if direction == 'west' else pos_dim_x + opening_text_size + 2
-                        svg += f'  <text x="{text_x}" y="{(final_start+wall_inside_end)/2}" text-anchor="middle" font-size="{opening_text_size}" fill="#666" transform="rotate(-90 {text_x} {(final_start+wall_inside_end)/2})">{final_dim_text}</text>\n'
-                        svg += '</g>\n'
+                if wall_inside_end - final_start > 5:  # Only show if meaningful distance
+                    write(_svg_final_opening_dimension(
+                        final_start, wall_inside_end,
+                        last_opening['y' if axis == 'x' else 'x'],
+                        opening_offset, direction, opening_text_size
+                    ))
 
     if dim_config['show_outer_dimensions'] or dim_config['show_inner_dimensions']:
         # Extract all edges
@@ -1210,7 +1249,7 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
                 edge_key = normalize_edge_key(edge['x1'], edge['y1'], edge['x2'], edge['y2'])
                 level = north_levels.get(edge_key, 0)
                 offset = base_offset + (level * offset_increment)
-                svg += svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], -offset, True, True, True)
+                write(svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], -offset, True, True, True))
 
             # South dimensions (below) - positive offset
             # Always dimension clear interior span (adjust both ends)
@@ -1218,7 +1257,7 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
                 edge_key = normalize_edge_key(edge['x1'], edge['y1'], edge['x2'], edge['y2'])
                 level = south_levels.get(edge_key, 0)
                 offset = base_offset + (level * offset_increment)
-                svg += svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], offset, True, True, True)
+                write(svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], offset, True, True, True))
 
             # West dimensions (left) - negative offset
             # Always dimension clear interior span (adjust both ends)
@@ -1226,7 +1265,7 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
                 edge_key = normalize_edge_key(edge['x1'], edge['y1'], edge['x2'], edge['y2'])
                 level = west_levels.get(edge_key, 0)
                 offset = base_offset + (level * offset_increment)
-                svg += svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], -offset, False, True, True)
+                write(svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], -offset, False, True, True))
 
             # East dimensions (right) - positive offset
             # Always dimension clear interior span (adjust both ends)
@@ -1234,7 +1273,7 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
                 edge_key = normalize_edge_key(edge['x1'], edge['y1'], edge['x2'], edge['y2'])
                 level = east_levels.get(edge_key, 0)
                 offset = base_offset + (level * offset_increment)
-                svg += svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], offset, False, True, True)
+                write(svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], offset, False, True, True))
 
             # Draw overall floor extent dimensions (outer boundary of this floor)
             # Use maximum offset level + 1 to ensure they're outside all other dimensions
@@ -1242,25 +1281,27 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
             max_south_level = max(south_levels.values()) if south_levels else 0
             max_west_level = max(west_levels.values()) if west_levels else 0
             max_east_level = max(east_levels.values()) if east_levels else 0
+            # Reused by the floor slab dimensions below
+            extent_levels = (max_north_level, max_south_level, max_west_level, max_east_level)
 
             floor_extent_offset_increment = offset_increment * 1.5  # Larger gap for clarity
 
             # Always draw floor extent dimensions based on calculated bounds
             # North total dimension
             floor_extent_offset = base_offset + (max_north_level + 1) * offset_increment + floor_extent_offset_increment
-            svg += svg_draw_dimension_line(min_x, min_y, max_x, min_y, -floor_extent_offset, True, False, False)
+            write(svg_draw_dimension_line(min_x, min_y, max_x, min_y, -floor_extent_offset, True, False, False))
 
             # South total dimension
             floor_extent_offset = base_offset + (max_south_level + 1) * offset_increment + floor_extent_offset_increment
-            svg += svg_draw_dimension_line(min_x, max_y, max_x, max_y, floor_extent_offset, True, False, False)
+            write(svg_draw_dimension_line(min_x, max_y, max_x, max_y, floor_extent_offset, True, False, False))
 
             # West total dimension
             floor_extent_offset = base_offset + (max_west_level + 1) * offset_increment + floor_extent_offset_increment
-            svg += svg_draw_dimension_line(min_x, min_y, min_x, max_y, -floor_extent_offset, False, False, False)
+            write(svg_draw_dimension_line(min_x, min_y, min_x, max_y, -floor_extent_offset, False, False, False))
 
             # East total dimension
             floor_extent_offset = base_offset + (max_east_level + 1) * offset_increment + floor_extent_offset_increment
-            svg += svg_draw_dimension_line(max_x, min_y, max_x, max_y, floor_extent_offset, False, False, False)
+            write(svg_draw_dimension_line(max_x, min_y, max_x, max_y, floor_extent_offset, False, False, False))
 
         # Draw interior dimensions
         if dim_config['show_inner_dimensions']:
@@ -1276,7 +1317,7 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
                 )
                 if not is_perimeter:
                     # Place dimension below the edge with clear span (both ends adjusted)
-                    svg += svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], inner_offset, True, True, True)
+                    write(svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], inner_offset, True, True, True))
 
             # Draw non-perimeter vertical edges
             # Always dimension clear interior span (adjust both ends)
@@ -1288,45 +1329,43 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
                 )
                 if not is_perimeter:
                     # Place dimension to the right of the edge with clear span (both ends adjusted)
-                    svg += svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], inner_offset, False, True, True)
+                    write(svg_draw_dimension_line(edge['x1'], edge['y1'], edge['x2'], edge['y2'], inner_offset, False, True, True))
 
     # Add room dimension labels
-    if dim_config['show_room_dimensions'] and 'objects' in floor_config:
+    if dim_config['show_room_dimensions']:
         room_text_size = dim_config['room_text_size']
-        wall_thickness = GLOBAL_CONFIG.get('wall_thickness', 8)
 
-        for obj in floor_config['objects']:
-            if obj.get('type') == 'room':
-                center_x = obj['x'] + obj['width'] / 2
-                center_y = obj['y'] + obj['length'] / 2
+        for obj in by_type['room']:
+            center_x = obj['x'] + obj['width'] / 2
+            center_y = obj['y'] + obj['length'] / 2
 
-                # Calculate carpet area (interior dimensions excluding wall thickness)
-                # Since we're dimensioning all walls with clear interior spans (both ends adjusted),
-                # the room dimensions should match those wall dimensions
-                # Always subtract wall thickness from all sides to match the wall dimensioning
-                t = obj.get('wall_thickness', wall_thickness)
+            # Calculate carpet area (interior dimensions excluding wall thickness)
+            # Since we're dimensioning all walls with clear interior spans (both ends adjusted),
+            # the room dimensions should match those wall dimensions
+            # Always subtract wall thickness from all sides to match the wall dimensioning
+            t = obj.get('wall_thickness', wall_thickness)
 
-                # Start with outer dimensions
-                # width = X direction (horizontal), length = Y direction (vertical)
-                # Subtract wall thickness from both ends of each dimension
-                # This matches the clear interior span shown on the wall dimensions
-                carpet_width = obj['width'] - (2 * t)
-                carpet_length = obj['length'] - (2 * t)
+            # Start with outer dimensions
+            # width = X direction (horizontal), length = Y direction (vertical)
+            # Subtract wall thickness from both ends of each dimension
+            # This matches the clear interior span shown on the wall dimensions
+            carpet_width = obj['width'] - (2 * t)
+            carpet_length = obj['length'] - (2 * t)
 
-                # Format dimensions
-                width_dim = format_dimension(carpet_width)
-                length_dim = format_dimension(carpet_length)
+            # Format dimensions
+            width_dim = format_dimension(carpet_width)
+            length_dim = format_dimension(carpet_length)
 
-                # Room name
-                room_name = obj.get('name', 'Room')
-                svg += f'<text x="{center_x}" y="{center_y - 8}" text-anchor="middle" font-size="{room_text_size}" font-weight="bold" fill="#333">{room_name}</text>\n'
+            # Room name
+            room_name = obj.get('name', 'Room')
+            write(f'<text x="{center_x}" y="{center_y - 8}" text-anchor="middle" font-size="{room_text_size}" font-weight="bold" fill="#333">{room_name}</text>\n')
 
-                # Carpet area dimensions
-                svg += f'<text x="{center_x}" y="{center_y + 8}" text-anchor="middle" font-size="{room_text_size - 2}" fill="#666">{width_dim} × {length_dim}</text>\n'
+            # Carpet area dimensions
+            write(f'<text x="{center_x}" y="{center_y + 8}" text-anchor="middle" font-size="{room_text_size - 2}" fill="#666">{width_dim} × {length_dim}</text>\n')
 
     # Add floor slab dimensions if they differ from overall floor dimensions
     # Position them outside all other dimensions to avoid overlap
-    if dim_config['show_outer_dimensions'] and 'objects' in floor_config:
+    if dim_config['show_outer_dimensions']:
         # Calculate overall floor dimensions
         overall_width = max_x - min_x
         overall_length = max_y - min_y
@@ -1337,11 +1376,9 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
         base_offset = dim_config['dimension_offset']
         offset_increment = dim_config['dimension_offset_increment']
 
-        # Use same levels as calculated for floor extent dimensions
-        max_north_level = max(north_levels.values()) if north_levels else 0
-        max_south_level = max(south_levels.values()) if south_levels else 0
-        max_west_level = max(west_levels.values()) if west_levels else 0
-        max_east_level = max(east_levels.values()) if east_levels else 0
+        # Use same levels as calculated for floor extent dimensions (this block
+        # shares the show_outer_dimensions gate, so extent_levels is set)
+        max_north_level, max_south_level, max_west_level, max_east_level = extent_levels
 
         floor_extent_offset_increment = offset_increment * 1.5
 
@@ -1352,67 +1389,86 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
         slab_offset_west = base_offset + (max_west_level + 1) * offset_increment + floor_extent_offset_increment * 0.5
         slab_offset_east = base_offset + (max_east_level + 1) * offset_increment + floor_extent_offset_increment * 0.5
 
-        for obj in floor_config['objects']:
-            if obj.get('type') == 'floor_slab':
-                slab_x = obj['x']
-                slab_y = obj['y']
-                slab_width = obj['width']
-                slab_length = obj['length']
-
-                # Check if slab dimensions differ from overall floor dimensions
-                # Allow small tolerance for floating point comparison
-                tolerance = 1.0
-                width_differs = abs(slab_width - overall_width) > tolerance or abs(slab_x - min_x) > tolerance
-                length_differs = abs(slab_length - overall_length) > tolerance or abs(slab_y - min_y) > tolerance
-
-                if width_differs or length_differs:
-                    # Add dimensions for this floor slab
-                    # Use a distinct style for floor slab dimensions
-                    svg += '<g class="floor-slab-dimension">\n'
-
-                    # Add horizontal dimensions (top and bottom)
-                    if width_differs:
-                        # Top dimension - positioned outside all other dimensions
-                        svg += svg_draw_dimension_line(
-                            slab_x, slab_y,
-                            slab_x + slab_width, slab_y,
-                            -slab_offset_north, True, False, False
-                        )
-                        # Bottom dimension
-                        svg += svg_draw_dimension_line(
-                            slab_x, slab_y + slab_length,
-                            slab_x + slab_width, slab_y + slab_length,
-                            slab_offset_south, True, False, False
-                        )
-
-                    # Add vertical dimensions (left and right)
-                    if length_differs:
-                        # Left dimension
-                        svg += svg_draw_dimension_line(
-                            slab_x, slab_y,
-                            slab_x, slab_y + slab_length,
-                            -slab_offset_west, False, False, False
-                        )
-                        # Right dimension
-                        svg += svg_draw_dimension_line(
-                            slab_x + slab_width, slab_y,
-                            slab_x + slab_width, slab_y + slab_length,
-                            slab_offset_east, False, False, False
-                        )
-
-                    svg += '</g>\n'
+        for obj in by_type['floor_slab']:
+            slab_x = obj['x']
+            slab_y = obj['y']
+            slab_width = obj['width']
+            slab_length = obj['length']
+
+            # Check if slab dimensions differ from overall floor dimensions
+            # Allow small tolerance for floating point comparison
+            tolerance = 1.0
+            width_differs = abs(slab_width - overall_width) > tolerance or abs(slab_x - min_x) > tolerance
+            length_differs = abs(slab_length - overall_length) > tolerance or abs(slab_y - min_y) > tolerance
+
+            if width_differs or length_differs:
+                # Add dimensions for this floor slab
+                # Use a distinct style for floor slab dimensions
+                write('<g class="floor-slab-dimension">\n')
+
+                # Add horizontal dimensions (top and bottom)
+                if width_differs:
+                    # Top dimension - positioned outside all other dimensions
+                    write(svg_draw_dimension_line(
+                        slab_x, slab_y,
+                        slab_x + slab_width, slab_y,
+                        -slab_offset_north, True, False, False
+                    ))
+                    # Bottom dimension
+                    write(svg_draw_dimension_line(
+                        slab_x, slab_y + slab_length,
+                        slab_x + slab_width, slab_y + slab_length,
+                        slab_offset_south, True, False, False
+                    ))
+
+                # Add vertical dimensions (left and right)
+                if length_differs:
+                    # Left dimension
+                    write(svg_draw_dimension_line(
+                        slab_x, slab_y,
+                        slab_x, slab_y + slab_length,
+                        -slab_offset_west, False, False, False
+                    ))
+                    # Right dimension
+                    write(svg_draw_dimension_line(
+                        slab_x + slab_width, slab_y,
+                        slab_x + slab_width, slab_y + slab_length,
+                        slab_offset_east, False, False, False
+                    ))
+
+                write('</g>\n')
 
     # Draw all pillars last so they appear on top
-    for pillar in pillars_to_draw:
-        svg += svg_draw_pillar(pillar['x'], pillar['y'], pillar['size'], pillar['width'], pillar['length'])
+    for obj in by_type['pillar']:
+        write(svg_draw_pillar(obj['x'], obj['y'], obj.get('size'), obj.get('width'), obj.get('length')))
 
     # Add title
-    svg += f'''</g>
+    content_end = buf.tell()
+    write(f'''</g>
 <text x="{width/2}" y="30" text-anchor="middle" font-size="16" font-weight="bold">{floor_name}</text>
-</svg>'''
+</svg>''')
 
-    # Save to file if path provided
-    if output_path:
+    return buf.getvalue(), _drawing_info(translate_x, translate_y, svg_width, svg_height,
+                                         content_start, content_end)
+
+
+def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
+                            scale: float = 2.0) -> str:
+    """
+    Generate an SVG floor plan from a floor configuration.
+
+    Args:
+        floor_config: Floor configuration dictionary
+        output_path: Path to save SVG file (if None, returns SVG string only)
+        scale: Pixels per unit (default: 2 pixels per unit)
+
+    Returns:
+        SVG content as string
+    """
+    svg, drawing = _render_floor_plan(floor_config, scale)
+
+    # Save to file if path provided (a floor with nothing to plan has no file)
+    if output_path and drawing is not None:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(svg)
         print(f"✓ Floor plan saved to: {output_path}")
@@ -1420,18 +1476,143 @@ def generate_floor_plan_svg(floor_config: dict, output_path: str = None,
     return svg
 
 
-def generate_elevation_view(house_config: dict, view_type: str, output_path: str = None, scale: float = 2.0) -> str:
+# Depth of each room wall that faces along an elevation's view axis, as
+# f(room_x, room_y, room_width, room_length, wall_thickness). Left/right
+# views see both west and east walls, front/back both north and south.
+_ROOM_WALL_DEPTH = {
+    'left': {
+        'west': lambda rx, ry, rw, rl, t: -rx,
+        'east': lambda rx, ry, rw, rl, t: -(rx + rw - t),
+    },
+    'right': {
+        'west': lambda rx, ry, rw, rl, t: -(rx + t),
+        'east': lambda rx, ry, rw, rl, t: rx + rw,
+    },
+    'front': {
+        'north': lambda rx, ry, rw, rl, t: -ry,
+        'south': lambda rx, ry, rw, rl, t: -(ry + rl),
+    },
+    'back': {
+        'north': lambda rx, ry, rw, rl, t: ry,
+        'south': lambda rx, ry, rw, rl, t: ry + rl,
+    },
+}
+
+
+def _gable_slope_extents(left_slope_angle: float, left_slope_length: float,
+                         right_slope_angle: float, right_slope_length: float) -> tuple:
     """
-    Generate an SVG elevation view (front, back, left, right) from house configuration.
+    Horizontal run and vertical drop of each gable slope.
+
+    Returns:
+        (left_horizontal, left_drop, right_horizontal, right_drop)
+    """
+    left_rad = math.radians(left_slope_angle)
+    right_rad = math.radians(right_slope_angle)
+    return (left_slope_length * math.cos(left_rad),
+            left_slope_length * math.sin(left_rad),
+            right_slope_length * math.cos(right_rad),
+            right_slope_length * math.sin(right_rad))
+
+
+# Beam orientations seen lengthwise in each elevation: ns beams run along
+# Y (left/right views), ew beams along X (front/back views).
+_VIEW_BEAM_ORIENTATIONS = {
+    'front': frozenset({'horizontal', 'ew'}),
+    'back': frozenset({'horizontal', 'ew'}),
+    'left': frozenset({'horizontal', 'ns'}),
+    'right': frozenset({'horizontal', 'ns'}),
+}
+
+# Elevation fill colours carried on slab/beam/staircase draw records
+_ELEV_SLAB_FILL = '#808080'
+_ELEV_BEAM_FILL = '#654321'
+_ELEV_STAIR_FILL = '#C19A6B'
+
+# Object types that sit on a wall rather than being drawn as depth-sorted
+# elevation objects.
+_OPENING_TYPES = frozenset({'door', 'window'})
+
+# Elevation primitives, as bound str.format callables like the opening
+# dimension fragments. A staircase step is its riser, tread and fill:
+# (x, bottom_y, top_y, tread_end_x, tread_run, riser_height, fill).
+_ELEV_RECT = '<rect x="{}" y="{}" width="{}" height="{}" fill="{}" stroke="#000" stroke-width="0.5"/>\n'.format
+_ELEV_LINE = '<line x1="{}" y1="{}" x2="{}" y2="{}" stroke="#000" stroke-width="0.5"/>\n'.format
+_ELEV_STAIR_STEP = (
+    '<line x1="{0}" y1="{1}" x2="{0}" y2="{2}" stroke="#000" stroke-width="0.5"/>\n'
+    '<line x1="{0}" y1="{2}" x2="{3}" y2="{2}" stroke="#000" stroke-width="0.5"/>\n'
+    '<rect x="{0}" y="{2}" width="{4}" height="{5}" fill="{6}" opacity="0.7"/>\n'
+).format
+
+
+# Elevation projections of a rectangular footprint (x, y, width, length)
+# onto (position along the view, visible width, depth). Depth grows toward
+# the viewer: front/left views negate the near edge, back/right views use
+# the far edge.
+def _proj_front(x, y, w, l):
+    return x, w, -y
+
+
+def _proj_back(x, y, w, l):
+    return x, w, y + l
+
+
+def _proj_left(x, y, w, l):
+    return y, l, -x
+
+
+def _proj_right(x, y, w, l):
+    return y, l, x + w
+
+
+_VIEW_PROJ = {
+    'front': _proj_front,
+    'back': _proj_back,
+    'left': _proj_left,
+    'right': _proj_right,
+}
+
+
+# Same projections for objects positioned by their centre (pillars).
+def _proj_centered_front(cx, cy, w, l):
+    return cx - w / 2, w, -(cy - l / 2)
+
+
+def _proj_centered_back(cx, cy, w, l):
+    return cx - w / 2, w, cy + l / 2
+
+
+def _proj_centered_left(cx, cy, w, l):
+    return cy - l / 2, l, -(cx - w / 2)
+
+
+def _proj_centered_right(cx, cy, w, l):
+    return cy - l / 2, l, cx + w / 2
+
+
+_VIEW_PROJ_CENTERED = {
+    'front': _proj_centered_front,
+    'back': _proj_centered_back,
+    'left': _proj_centered_left,
+    'right': _proj_centered_right,
+}
+
+
+def _render_elevation_view(house_config: dict, view_type: str, output_path: str = None,
+                           scale: float = 2.0) -> tuple:
+    """
+    Render an SVG elevation view (front, back, left, right) document.
 
     Args:
         house_config: Complete house configuration
         view_type: 'front', 'back', 'left', or 'right'
-        output_path: Path to save SVG file (if None, returns SVG string only)
+        output_path: Where the SVG will be saved; only used to place the
+            optional objects_debug_*.json dumps
         scale: SVG scaling factor
 
     Returns:
-        SVG string
+        (svg, drawing) - the SVG string and a dict locating its drawing
+        group (see _drawing_info)
     """
     # Get site and plinth info
     site = house_config.get('site', {})
@@ -1472,9 +1653,10 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
     total_height = plinth_height
 
     # Add floor heights
+    floor_heights = GLOBAL_CONFIG['floor_heights']
     for floor_config in floors:
         floor_num = floor_config['floor_number']
-        floor_height = GLOBAL_CONFIG['floor_heights'].get(floor_num, 100)
+        floor_height = floor_heights.get(floor_num, 100)
         total_height += floor_height
 
     # Check for roof
@@ -1485,7 +1667,6 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                     ridge_z = obj.get('ridge_z', 0)
                     total_height = max(total_height, ridge_z)
                 elif obj.get('type') == 'hip_roof':
-                    import math
                     span_x = obj['eave_x_east'] - obj['eave_x_west']
                     span_y = obj['eave_y_south'] - obj['eave_y_north']
                     uniform = obj.get('slope_angle')
@@ -1498,8 +1679,8 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                     total_height = max(total_height, obj['eave_z'] + h)
 
     # SVG dimensions - increased margins for dimensions
-    dim_config = GLOBAL_CONFIG.get('dimensions', {})
-    if dim_config.get('show_outer_dimensions', True):
+    show_outer_dimensions = GLOBAL_CONFIG.get('dimensions', {}).get('show_outer_dimensions', True)
+    if show_outer_dimensions:
         # Account for dimension lines and text
         horizontal_margin = 150  # Space for left/right vertical dimensions (increased from 100)
         vertical_margin = 150    # Space for top/bottom horizontal dimensions (increased from 100)
@@ -1512,33 +1693,38 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
     svg_width = width * scale + 2 * horizontal_margin
     svg_height = total_height * scale + 2 * vertical_margin + title_space
 
+    # Title in the title space area, fixed by the sheet size: centered
+    # horizontally and vertically in title_space, slightly offset
+    title_svg = f'<text x="{svg_width/2}" y="{title_space / 2 + 10}" text-anchor="middle" font-size="18" font-weight="bold" fill="#333">{view_name}</text>\n'
+
     # Helper function to convert world Z to SVG Y (inverted)
     def z_to_y(z):
         """Convert world Z coordinate to SVG Y coordinate (flip vertical axis)"""
         return total_height - z
 
-    # Helper function to convert world X/Y to SVG X based on view type
-    def world_to_svg_x(coord, obj_width=0):
-        """
-        Convert world coordinate to SVG X coordinate (mirror for front and right views).
-
-        Args:
-            coord: World X or Y coordinate (left edge of object)
-            obj_width: Width of object (needed for proper mirroring)
-
-        Returns:
-            SVG X coordinate
-        """
-        if view_type == 'front':
-            # Front view: mirror X so west (0) is on left, east (width) is on right
+    # Helper function to convert world X/Y to SVG X based on view type.
+    # The view is fixed for the whole drawing, so pick the variant once
+    # instead of re-testing view_type on every call.
+    mirrored_view = view_type in ('front', 'right')
+    if mirrored_view:
+        # Front view: mirror X so west (0) is on left, east (width) is on right
+        # Right view: mirror Y so south (0) is on left, north (width) is on right
+        def world_to_svg_x(coord, obj_width=0):
+            """
+            Convert world coordinate to SVG X coordinate (mirrored view).
+
+            Args:
+                coord: World X or Y coordinate (left edge of object)
+                obj_width: Width of object (needed for proper mirroring)
+
+            Returns:
+                SVG X coordinate
+            """
             # For a rectangle at x with width w, the mirrored position is: width - (x + w)
             return width - (coord + obj_width)
-        elif view_type == 'right':
-            # Right view: mirror Y so south (0) is on left, north (width) is on right
-            # For a rectangle at y with width w, the mirrored position is: width - (y + w)
-            return width - (coord + obj_width)
-        else:
-            # Back, left views: keep as is
+    else:
+        def world_to_svg_x(coord, obj_width=0):
+            """Convert world coordinate to SVG X coordinate (back/left views keep it as is)."""
             return coord
 
     # Compass direction a wall must face to point at the viewer in this
@@ -1551,7 +1737,9 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
     # Start SVG
     # Add title_space to vertical translation to push content down
     content_top_margin = vertical_margin + title_space
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+    buf = io.StringIO()
+    write = buf.write
+    write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" width="{svg_width}" height="{svg_height}" viewBox="0 0 {svg_width} {svg_height}">
 <title>{view_name}</title>
 <defs>
@@ -1559,18 +1747,18 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
         text {{ font-family: Arial, sans-serif; }}
     </style>
 </defs>
-<g transform="translate({horizontal_margin}, {content_top_margin}) scale({scale}, {scale})">
-
-'''
+<g transform="translate({horizontal_margin}, {content_top_margin}) scale({scale}, {scale})">''')
+    content_start = buf.tell()
+    write('\n\n')
 
     # Draw ground line (at ground level, Z=0)
     ground_y = z_to_y(0)
-    svg += f'<line x1="0" y1="{ground_y}" x2="{width}" y2="{ground_y}" stroke="#666" stroke-width="2" stroke-dasharray="5,5"/>\n'
+    write(f'<line x1="0" y1="{ground_y}" x2="{width}" y2="{ground_y}" stroke="#666" stroke-width="2" stroke-dasharray="5,5"/>\n')
 
     # Draw plinth (from ground to plinth top)
     plinth_bottom_y = z_to_y(0)
     plinth_top_y = z_to_y(plinth_height)
-    svg += f'<rect x="0" y="{plinth_top_y}" width="{width}" height="{plinth_bottom_y - plinth_top_y}" fill="#A0826D" stroke="#000" stroke-width="1"/>\n'
+    write(f'<rect x="0" y="{plinth_top_y}" width="{width}" height="{plinth_bottom_y - plinth_top_y}" fill="#A0826D" stroke="#000" stroke-width="1"/>\n')
 
     # Current Z level
     current_z = plinth_height
@@ -1581,19 +1769,22 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
         {'name': 'Plinth Top', 'z': plinth_height, 'height': 0}
     ]
 
-    # Track openings for dimensioning
-    elevation_openings = []
+    # Track openings for dimensioning, grouped by wall name as they are
+    # drawn (doors and windows together, walls in first-drawn order)
+    elevation_openings = defaultdict(list)
 
     # Every window on a wall that faces the viewer — drives sill-height
     # dimensioning (section 5). Separate from elevation_openings, which is
     # front-most-wall only and drives the horizontal opening dimensions.
     sill_windows = []
 
-    # Track walls with non-standard heights for dimensioning
-    walls_with_custom_heights = []
+    # Track walls with non-standard heights for dimensioning, keyed by the
+    # normalized (min, max) height range so only the first wall with a
+    # given range is kept (e.g., walls 0→47 and 47→0 share one dimension)
+    walls_with_custom_heights = {}
 
-    # Collect roof SVG to draw last (so it's not hidden by walls)
-    roof_svg = ""
+    # Collect roof SVG fragments to draw last (so it's not hidden by walls)
+    roof_parts = []
 
     # Draw each floor
     slab_thickness = GLOBAL_CONFIG.get('floor_slab_thickness', 4)
@@ -1610,98 +1801,111 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
         'wall': 2,
         'pillar': 3
     })
+    priority_of = type_priority.get
+    P_SLAB = priority_of('floor_slab', 1)
+    P_BEAM = priority_of('beam', 0)
+    P_STAIR = priority_of('staircase', 1)
+    P_WALL = priority_of('wall', 2)
+    P_PILLAR = priority_of('pillar', 3)
+
+    # Shared, never-mutated openings list for walls without doors/windows
+    # and for pillars
+    NO_OPENINGS = []
 
     # COLLECT ALL OBJECTS FROM ALL FLOORS FIRST
     # This prevents pillars from being overdrawn by objects from higher floors
     all_objects_to_draw = []
 
+    # Depth-sort key for this view. Front/left sort ascending on Y/X
+    # (smaller = farther away = drawn first); back/right sort descending,
+    # which is expressed as a negated coordinate. Walls use the end nearest
+    # the far side. Resolved once per view instead of per object.
+    depth_axis = 'y' if view_type in ('front', 'back') else 'x'
+    depth_sign = 1 if view_type in ('front', 'left') else -1
+    wall_far_end = min if depth_sign == 1 else max
+    wall_start_key = 'start_' + depth_axis
+    wall_end_key = 'end_' + depth_axis
+
+    # Per-floor objects_debug_*.json dumps are opt-in via KONKAN_DEBUG_DUMP and
+    # are written next to the SVG. When output_path is None (elevation being
+    # composed into a combined view) they are skipped so runs don't scatter
+    # JSON files into cwd.
+    debug_dump_dir = None
+    if output_path and os.environ.get('KONKAN_DEBUG_DUMP'):
+        debug_dump_dir = os.path.dirname(output_path)
+
+    # World axis the view runs along (also the opening coordinate for walls),
+    # room walls seen face-on (wall direction -> depth function) and beam
+    # orientations seen lengthwise
+    view_along_y = view_type in ('left', 'right')
+    view_coord_key = 'y' if view_along_y else 'x'
+    room_wall_depth = _ROOM_WALL_DEPTH[view_type]
+    visible_beam_orientations = _VIEW_BEAM_ORIENTATIONS[view_type]
+
+    # Footprint -> (svg x, visible width, depth) for rectangular objects
+    project = _VIEW_PROJ[view_type]
+    project_centered = _VIEW_PROJ_CENTERED[view_type]
+
+    # C-level sort keys: (depth, priority) for the per-floor depth tuples and
+    # for the draw records, every one of which carries a 'priority'
+    depth_then_priority = itemgetter(0, 1)
+    draw_order = itemgetter('depth', 'priority')
+
     for floor_config in floors:
         floor_num = floor_config['floor_number']
-        floor_height = GLOBAL_CONFIG['floor_heights'].get(floor_num, 100)
+        floor_height = floor_heights.get(floor_num, 100)
 
-        # Collect all objects with their depth coordinate for sorting
+        # Collect all objects with their depth coordinate for sorting.
+        # Doors and windows are not depth sorted; they are set aside in
+        # the same pass and grouped onto their walls below.
         floor_objects_with_depth = []
+        floor_openings = []
 
         if 'objects' in floor_config:
             for obj in floor_config['objects']:
                 obj_type = obj.get('type')
-                depth = 0  # Depth coordinate for sorting
-                priority = type_priority.get(obj_type, 2)  # Default to wall/room priority
-
-                # Calculate depth based on view type
-                # Only walls, rooms, slabs, beams, staircases, and pillars are depth-sorted (NOT doors/windows)
-                if view_type == 'front':
-                    # Front view: sort by Y (smaller Y = farther away = draw first)
-                    if obj_type in ['floor_slab', 'beam', 'staircase']:
-                        depth = obj.get('y', 0)
-                    elif obj_type == 'room':
-                        depth = obj.get('y', 0)
-                    elif obj_type == 'wall':
-                        depth = min(obj.get('start_y', 0), obj.get('end_y', 0))
-                    elif obj_type == 'pillar':
-                        depth = obj.get('y', 0)
-                elif view_type == 'back':
-                    # Back view: sort by Y (larger Y = farther away = draw first)
-                    if obj_type in ['floor_slab', 'beam', 'staircase']:
-                        depth = -obj.get('y', 0)  # Negative to reverse sort
-                    elif obj_type == 'room':
-                        depth = -obj.get('y', 0)
-                    elif obj_type == 'wall':
-                        depth = -max(obj.get('start_y', 0), obj.get('end_y', 0))
-                    elif obj_type == 'pillar':
-                        depth = -obj.get('y', 0)
-                elif view_type == 'left':
-                    # Left view: sort by X (smaller X = farther away = draw first)
-                    if obj_type in ['floor_slab', 'beam', 'staircase']:
-                        depth = obj.get('x', 0)
-                    elif obj_type == 'room':
-                        depth = obj.get('x', 0)
-                    elif obj_type == 'wall':
-                        depth = min(obj.get('start_x', 0), obj.get('end_x', 0))
-                    elif obj_type == 'pillar':
-                        depth = obj.get('x', 0)
-                elif view_type == 'right':
-                    # Right view: sort by X (larger X = farther away = draw first)
-                    if obj_type in ['floor_slab', 'beam', 'staircase']:
-                        depth = -obj.get('x', 0)
-                    elif obj_type == 'room':
-                        depth = -obj.get('x', 0)
-                    elif obj_type == 'wall':
-                        depth = -max(obj.get('start_x', 0), obj.get('end_x', 0))
-                    elif obj_type == 'pillar':
-                        depth = -obj.get('x', 0)
-
-                # Skip doors and windows - they're not depth sorted
-                if obj_type in ['door', 'window']:
+
+                if obj_type in _OPENING_TYPES:
+                    floor_openings.append(obj)
                     continue
 
+                priority = priority_of(obj_type, 2)  # Default to wall/room priority
+
+                # Only walls, rooms, slabs, beams, staircases, and pillars are depth-sorted
+                if obj_type in ['floor_slab', 'beam', 'staircase', 'room', 'pillar']:
+                    depth = depth_sign * obj.get(depth_axis, 0)
+                elif obj_type == 'wall':
+                    depth = depth_sign * wall_far_end(obj.get(wall_start_key, 0), obj.get(wall_end_key, 0))
+                else:
+                    depth = 0
+
                 floor_objects_with_depth.append((depth, priority, obj))
 
-        # Sort objects by depth (back to front), then by type priority for conflict resolution
-        floor_objects_with_depth.sort(key=lambda x: (x[0], x[1]))
+        # Sort objects by depth (back to front), then by type priority for conflict resolution.
+        # Not redundant with the draw-record sorts below: this fixes the order
+        # records are appended in, which is what breaks (depth, priority) ties
+        # in those stable sorts (e.g. one room's south wall and the next
+        # room's north wall on the same line). elevationView.ts sorts the same way.
+        floor_objects_with_depth.sort(key=depth_then_priority)
 
         # Pre-group doors/windows with their parent walls for efficient rendering
         # Key format: '{room_name}_{direction}' for room walls, or '{wall_name}' for standalone walls
-        wall_openings = {}
-        if 'objects' in floor_config:
-            for obj in floor_config['objects']:
-                if obj.get('type') in ['door', 'window']:
-                    # Get the parent wall identifier from the door/window config
-                    if 'room' in obj:
-                        # Door/window belongs to a specific room's wall
-                        room_name = obj['room']
-                        direction = obj.get('direction', '').lower()
-                        wall_key = f"{room_name}_{direction}"
-                    elif 'wall_name' in obj or 'wall' in obj:
-                        # Door/window belongs to a standalone wall
-                        wall_key = obj.get('wall_name') or obj.get('wall')
-                    else:
-                        # Skip if no parent wall specified
-                        continue
+        wall_openings = defaultdict(list)
+        for obj in floor_openings:
+            # Get the parent wall identifier from the door/window config
+            if 'room' in obj:
+                # Door/window belongs to a specific room's wall
+                room_name = obj['room']
+                direction = obj.get('direction', '').lower()
+                wall_key = f"{room_name}_{direction}"
+            elif 'wall_name' in obj or 'wall' in obj:
+                # Door/window belongs to a standalone wall
+                wall_key = obj.get('wall_name') or obj.get('wall')
+            else:
+                # Skip if no parent wall specified
+                continue
 
-                    if wall_key not in wall_openings:
-                        wall_openings[wall_key] = []
-                    wall_openings[wall_key].append(obj)
+            wall_openings[wall_key].append(obj)
 
         # UNIFIED RENDERING: Collect ALL objects (slabs, beams, walls, pillars) with depth
         objects_to_draw = []
@@ -1722,7 +1926,8 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
         })
 
         for depth, priority, obj in floor_objects_with_depth:
-            obj_type = obj.get('type')
+            g = obj.get
+            obj_type = g('type')
 
             if obj_type == 'floor_slab':
                 # Add floor slab to unified rendering
@@ -1730,100 +1935,54 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                 slab_y = obj['y']
                 slab_width = obj['width']
                 slab_length = obj['length']
-                slab_thick = obj.get('thickness', slab_thickness)
+                slab_thick = g('thickness', slab_thickness)
 
                 # Calculate position and depth based on view
-                if view_type == 'left':
-                    # Left view: Y position, -X depth
-                    obj_x = slab_y
-                    obj_width = slab_length
-                    obj_depth = -slab_x
-                elif view_type == 'right':
-                    # Right view: Y position, +X depth
-                    obj_x = slab_y
-                    obj_width = slab_length
-                    obj_depth = slab_x + slab_width
-                elif view_type == 'front':
-                    # Front view: X position, -Y depth
-                    obj_x = slab_x
-                    obj_width = slab_width
-                    obj_depth = -slab_y
-                elif view_type == 'back':
-                    # Back view: X position, +Y depth
-                    obj_x = slab_x
-                    obj_width = slab_width
-                    obj_depth = slab_y + slab_length
-                else:
-                    continue
+                obj_x, obj_width, obj_depth = project(slab_x, slab_y, slab_width, slab_length)
 
                 objects_to_draw.append({
                     'type': 'floor_slab',
-                    'name': f"Slab_{obj.get('name', '')}",
+                    'name': f"Slab_{g('name', '')}",
                     'depth': obj_depth,
-                    'priority': type_priority.get('floor_slab', 1),
+                    'priority': P_SLAB,
                     'x': obj_x,
                     'width': obj_width,
                     'height': slab_thick,
                     'z': slab_z,
-                    'fill': '#808080'
+                    'fill': _ELEV_SLAB_FILL
                 })
 
             elif obj_type == 'beam':
+                # Beams seen end-on in this view are skipped before any
+                # size or position math
+                if g('orientation', 'horizontal') not in visible_beam_orientations:
+                    continue
+
                 # Add beam to unified rendering
                 beam_x = obj['x']
                 beam_y = obj['y']
-                beam_width = obj.get('width', beam_size)
-                beam_length = obj.get('length', beam_size)
-                beam_height = obj.get('height', beam_size)
-                beam_orient = obj.get('orientation', 'horizontal')
-
-                # Calculate position and depth based on view and orientation
-                if view_type == 'left':
-                    if beam_orient in ['horizontal', 'ns']:
-                        obj_x = beam_y
-                        obj_width = beam_length
-                        obj_depth = -beam_x
-                    else:  # ew orientation - not visible or just a point
-                        continue
-                elif view_type == 'right':
-                    if beam_orient in ['horizontal', 'ns']:
-                        obj_x = beam_y
-                        obj_width = beam_length
-                        obj_depth = beam_x + beam_width
-                    else:
-                        continue
-                elif view_type == 'front':
-                    if beam_orient in ['horizontal', 'ew']:
-                        obj_x = beam_x
-                        obj_width = beam_width
-                        obj_depth = -beam_y
-                    else:
-                        continue
-                elif view_type == 'back':
-                    if beam_orient in ['horizontal', 'ew']:
-                        obj_x = beam_x
-                        obj_width = beam_width
-                        obj_depth = beam_y + beam_length
-                    else:
-                        continue
-                else:
-                    continue
+                beam_width = g('width', beam_size)
+                beam_length = g('length', beam_size)
+                beam_height = g('height', beam_size)
+
+                # Calculate position and depth based on view
+                obj_x, obj_width, obj_depth = project(beam_x, beam_y, beam_width, beam_length)
 
                 # Place beam at floor slab level, plus any user-supplied
                 # lift (e.g. a ring beam at the top of the floor's walls).
                 # z_offset_ft is in feet (10 units / ft in this codebase).
-                beam_z = slab_z + float(obj.get('z_offset_ft', 0.0)) * 10.0
+                beam_z = slab_z + float(g('z_offset_ft', 0.0)) * 10.0
 
                 objects_to_draw.append({
                     'type': 'beam',
-                    'name': f"Beam_{obj.get('name', '')}",
+                    'name': f"Beam_{g('name', '')}",
                     'depth': obj_depth,
-                    'priority': type_priority.get('beam', 0),
+                    'priority': P_BEAM,
                     'x': obj_x,
                     'width': obj_width,
                     'height': beam_height,
                     'z': beam_z,
-                    'fill': '#654321'
+                    'fill': _ELEV_BEAM_FILL
                 })
 
             elif obj_type == 'staircase':
@@ -1833,10 +1992,10 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                     # New format with compass direction
                     start_x = obj['start_x']
                     start_y = obj['start_y']
-                    step_width = obj.get('step_width', 30)
-                    step_tread = obj.get('step_tread', 10)
-                    num_steps = obj.get('num_steps', 10)
-                    compass_dir = obj.get('direction', 'north')
+                    step_width = g('step_width', 30)
+                    step_tread = g('step_tread', 10)
+                    num_steps = g('num_steps', 10)
+                    compass_dir = g('direction', 'north')
 
                     # Convert compass direction to x, y, width, length
                     # North = upward (decreasing Y), South = downward (increasing Y)
@@ -1858,7 +2017,7 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                     stair_y = obj['y']
                     stair_width = obj['width']
                     stair_length = obj['length']
-                    num_steps = obj.get('num_steps')
+                    num_steps = g('num_steps')
 
                     # Auto-calculate steps if not provided
                     if num_steps is None:
@@ -1866,300 +2025,195 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
 
                 # Calculate total rise (vertical height)
                 # Use step_rise from config if available, otherwise assume 7 inches (standard)
-                step_rise = obj.get('step_rise', 7)
+                step_rise = g('step_rise', 7)
                 total_rise = num_steps * step_rise
 
                 # Calculate position and depth based on view
-                if view_type == 'left':
-                    # Left view: Y position, -X depth
-                    obj_x = stair_y
-                    obj_width = stair_length
-                    obj_depth = -stair_x
-                elif view_type == 'right':
-                    # Right view: Y position, +X depth
-                    obj_x = stair_y
-                    obj_width = stair_length
-                    obj_depth = stair_x + stair_width
-                elif view_type == 'front':
-                    # Front view: X position, -Y depth
-                    obj_x = stair_x
-                    obj_width = stair_width
-                    obj_depth = -stair_y
-                elif view_type == 'back':
-                    # Back view: X position, +Y depth
-                    obj_x = stair_x
-                    obj_width = stair_width
-                    obj_depth = stair_y + stair_length
-                else:
-                    continue
+                obj_x, obj_width, obj_depth = project(stair_x, stair_y, stair_width, stair_length)
 
                 objects_to_draw.append({
                     'type': 'staircase',
-                    'name': f"Stair_{obj.get('name', '')}",
+                    'name': f"Stair_{g('name', '')}",
                     'depth': obj_depth,
-                    'priority': type_priority.get('staircase', 1),
+                    'priority': P_STAIR,
                     'x': obj_x,
                     'width': obj_width,
                     'height': total_rise,
                     'z': wall_z,
                     'num_steps': num_steps,
-                    'fill': '#C19A6B'
+                    'fill': _ELEV_STAIR_FILL
                 })
 
             elif obj_type == 'room':
-                room_name = obj.get('name', '')
-                walls_list = obj.get('walls', ['north', 'south', 'east', 'west'])
+                room_name = g('name', '')
+                walls_list = g('walls', ['north', 'south', 'east', 'west'])
                 walls_list = [w.lower() for w in walls_list]
-                wall_heights = obj.get('wall_heights', {})
+                wall_heights = g('wall_heights', {})
                 room_x = obj['x']
                 room_y = obj['y']
                 room_width = obj['width']
                 room_length = obj['length']
 
+                # Position along the view axis is the same for every wall
+                room_along = room_y if view_along_y else room_x
+                room_span = room_length if view_along_y else room_width
+
                 # Extract each wall of the room as a separate entity
                 for direction in walls_list:
+                    # Show ALL walls facing along the view axis and let depth
+                    # sorting handle visibility; side walls are edge-on.
+                    depth_of = room_wall_depth.get(direction)
+                    if depth_of is None:
+                        continue
+
                     wall_key = f"{room_name}_{direction}"
-                    wh_entry = wall_heights.get(direction, obj.get('height', floor_height))
+                    wh_entry = wall_heights.get(direction, g('height', floor_height))
                     # After the nested-walls refactor, wall_heights entries can be
                     # dicts (`{'height': N, 'height_end': N}`) — unwrap so
                     # downstream code that expects a scalar wall_height still works.
                     wall_height = wh_entry.get('height', floor_height) if isinstance(wh_entry, dict) else wh_entry
 
-                    # Calculate wall depth and position based on view type
-                    # Show ALL walls in each view and let depth sorting handle visibility
-                    if view_type in ['left', 'right']:
-                        # Left/right views: show both west AND east walls
-                        if direction == 'west':
-                            depth = -room_x if view_type == 'left' else -(room_x + wall_thickness)
-                            objects_to_draw.append({
-                                'type': 'wall',
-                                'name': wall_key,
-                                'depth': depth,
-                                'faces_viewer': direction == viewer_facing_dir,
-                                'priority': type_priority.get('wall', 2),
-                                'x': room_y,
-                                'width': room_length,
-                                'height': wall_height,
-                                'z': wall_z,
-                                'openings': wall_openings.get(wall_key, []),
-                                'coord_key': 'y',
-                                'floor_height_expected': floor_height
-                            })
-                        elif direction == 'east':
-                            depth = (room_x + room_width) if view_type == 'right' else -(room_x + room_width - wall_thickness)
-                            objects_to_draw.append({
-                                'type': 'wall',
-                                'name': wall_key,
-                                'depth': depth,
-                                'faces_viewer': direction == viewer_facing_dir,
-                                'priority': type_priority.get('wall', 2),
-                                'x': room_y,
-                                'width': room_length,
-                                'height': wall_height,
-                                'z': wall_z,
-                                'openings': wall_openings.get(wall_key, []),
-                                'coord_key': 'y',
-                                'floor_height_expected': floor_height
-                            })
-                    elif view_type in ['front', 'back']:
-                        # Front/back views: show both north AND south walls
-                        if direction == 'north':
-                            depth = -room_y if view_type == 'front' else room_y
-                            objects_to_draw.append({
-                                'type': 'wall',
-                                'name': wall_key,
-                                'depth': depth,
-                                'faces_viewer': direction == viewer_facing_dir,
-                                'priority': type_priority.get('wall', 2),
-                                'x': room_x,
-                                'width': room_width,
-                                'height': wall_height,
-                                'z': wall_z,
-                                'openings': wall_openings.get(wall_key, []),
-                                'coord_key': 'x',
-                                'floor_height_expected': floor_height
-                            })
-                        elif direction == 'south':
-                            depth = (room_y + room_length) if view_type == 'back' else -(room_y + room_length)
-                            objects_to_draw.append({
-                                'type': 'wall',
-                                'name': wall_key,
-                                'depth': depth,
-                                'faces_viewer': direction == viewer_facing_dir,
-                                'priority': type_priority.get('wall', 2),
-                                'x': room_x,
-                                'width': room_width,
-                                'height': wall_height,
-                                'z': wall_z,
-                                'openings': wall_openings.get(wall_key, []),
-                                'coord_key': 'x',
-                                'floor_height_expected': floor_height
-                            })
+                    objects_to_draw.append({
+                        'type': 'wall',
+                        'name': wall_key,
+                        'depth': depth_of(room_x, room_y, room_width, room_length, wall_thickness),
+                        'faces_viewer': direction == viewer_facing_dir,
+                        'priority': P_WALL,
+                        'x': room_along,
+                        'width': room_span,
+                        'height': wall_height,
+                        'z': wall_z,
+                        'openings': wall_openings.get(wall_key, NO_OPENINGS),
+                        'coord_key': view_coord_key,
+                        'floor_height_expected': floor_height
+                    })
 
             elif obj_type == 'wall':
-                wall_name = obj.get('name', '')
-                # Standalone walls may declare which way they face; if so, only
-                # dimension their sills on the matching elevation. Without a
-                # `facing`, fall back to dimensioning wherever the wall is drawn.
-                wall_facing = obj.get('facing')
-                wall_facing = wall_facing.lower() if isinstance(wall_facing, str) else None
-                wall_faces_viewer = (wall_facing == viewer_facing_dir) if wall_facing else True
                 start_x = obj['start_x']
                 start_y = obj['start_y']
                 end_x = obj['end_x']
                 end_y = obj['end_y']
-                wall_height_val = obj.get('height', floor_height)
-                wall_height_end = obj.get('height_end', wall_height_val)
-
-                is_horizontal = abs(end_y - start_y) < 1
-                is_vertical = abs(end_x - start_x) < 1
 
-                # Only add if visible in this view
-                if view_type in ['front', 'back'] and is_horizontal:
+                # Only add if visible in this view: front/back see walls that
+                # run along X (horizontal), left/right walls along Y (vertical)
+                if view_along_y:
+                    if not -1 < end_x - start_x < 1:
+                        continue
+                    wall_length = abs(end_y - start_y)
+                    wall_pos = min(start_y, end_y)
+                    # Left view: -X (larger X = further back), Right view: +X (larger X = closer)
+                    depth = -start_x if view_type == 'left' else start_x
+                else:
+                    if not -1 < end_y - start_y < 1:
+                        continue
                     wall_length = abs(end_x - start_x)
                     wall_pos = min(start_x, end_x)
                     # Front: smaller Y (north) = closer = negative depth
                     # Back: larger Y (south) = closer = positive depth
                     depth = -start_y if view_type == 'front' else start_y
 
-                    objects_to_draw.append({
-                        'type': 'wall',
-                        'name': wall_name,
-                        'depth': depth,
-                        'faces_viewer': wall_faces_viewer,
-                        'priority': type_priority.get('wall', 2),
-                        'x': wall_pos,
-                        'width': wall_length,
-                        'height': wall_height_val,
-                        'height_end': wall_height_end,
-                        'z': wall_z,
-                        'openings': wall_openings.get(wall_name, []),
-                        'coord_key': 'x',  # Use 'x' coordinate for front/back view
-                        'floor_height_expected': floor_height
-                    })
-                elif view_type in ['left', 'right'] and is_vertical:
-                    wall_length = abs(end_y - start_y)
-                    wall_pos = min(start_y, end_y)
-                    # Left view: -X (larger X = further back), Right view: +X (larger X = closer)
-                    depth = -start_x if view_type == 'left' else start_x
+                wall_name = g('name', '')
+                # Standalone walls may declare which way they face; if so, only
+                # dimension their sills on the matching elevation. Without a
+                # `facing`, fall back to dimensioning wherever the wall is drawn.
+                wall_facing = g('facing')
+                wall_facing = wall_facing.lower() if isinstance(wall_facing, str) else None
+                wall_faces_viewer = (wall_facing == viewer_facing_dir) if wall_facing else True
+                wall_height_val = g('height', floor_height)
+                wall_height_end = g('height_end', wall_height_val)
 
-                    objects_to_draw.append({
-                        'type': 'wall',
-                        'name': wall_name,
-                        'depth': depth,
-                        'faces_viewer': wall_faces_viewer,
-                        'priority': type_priority.get('wall', 2),
-                        'x': wall_pos,
-                        'width': wall_length,
-                        'height': wall_height_val,
-                        'height_end': wall_height_end,
-                        'z': wall_z,
-                        'openings': wall_openings.get(wall_name, []),
-                        'coord_key': 'y',  # Use 'y' coordinate for left/right view
-                        'floor_height_expected': floor_height
-                    })
+                objects_to_draw.append({
+                    'type': 'wall',
+                    'name': wall_name,
+                    'depth': depth,
+                    'faces_viewer': wall_faces_viewer,
+                    'priority': P_WALL,
+                    'x': wall_pos,
+                    'width': wall_length,
+                    'height': wall_height_val,
+                    'height_end': wall_height_end,
+                    'z': wall_z,
+                    'openings': wall_openings.get(wall_name, NO_OPENINGS),
+                    'coord_key': view_coord_key,
+                    'floor_height_expected': floor_height
+                })
 
             elif obj_type == 'pillar':
                 # Get pillar dimensions with backward compatibility
                 default_size = wall_thickness
-                pillar_width = obj.get('width', obj.get('size', default_size))   # X dimension
-                pillar_length = obj.get('length', obj.get('size', default_size))  # Y dimension
-                pillar_height = obj.get('height', floor_height)
+                pillar_width = g('width', g('size', default_size))   # X dimension
+                pillar_length = g('length', g('size', default_size))  # Y dimension
+                pillar_height = g('height', floor_height)
                 pillar_world_x = obj['x']
                 pillar_world_y = obj['y']
 
                 # Calculate depth and position based on view
-                # Pillar coords are CENTER, so we need to use nearest edge for depth
-                # For elevations, we see different cross-sections:
-                # - Front/Back: see pillar width (X dimension)
-                # - Left/Right: see pillar length (Y dimension)
-                if view_type == 'left':
-                    # Left view: looking from west (negative X), see pillar length (Y dimension)
-                    pillar_visible_width = pillar_length
-                    pillar_x = pillar_world_y - pillar_length / 2
-                    depth = -(pillar_world_x - pillar_width / 2)
-                elif view_type == 'right':
-                    # Right view: looking from east (positive X), see pillar length (Y dimension)
-                    pillar_visible_width = pillar_length
-                    pillar_x = pillar_world_y - pillar_length / 2
-                    depth = pillar_world_x + pillar_width / 2
-                elif view_type == 'front':
-                    # Front view: looking from north (negative Y), see pillar width (X dimension)
-                    pillar_visible_width = pillar_width
-                    pillar_x = pillar_world_x - pillar_width / 2
-                    depth = -(pillar_world_y - pillar_length / 2)
-                elif view_type == 'back':
-                    # Back view: looking from south (positive Y), see pillar width (X dimension)
-                    pillar_visible_width = pillar_width
-                    pillar_x = pillar_world_x - pillar_width / 2
-                    depth = pillar_world_y + pillar_length / 2
-                else:
-                    continue
+                # Pillar coords are CENTER, so the nearest edge is used for depth.
+                # Front/back views see the pillar width (X), left/right its length (Y).
+                pillar_x, pillar_visible_width, depth = project_centered(
+                    pillar_world_x, pillar_world_y, pillar_width, pillar_length)
 
                 # Add pillar to objects array for depth sorting
                 objects_to_draw.append({
                     'type': 'pillar',
-                    'name': f"Pillar_{obj.get('name', '')}",
+                    'name': f"Pillar_{g('name', '')}",
                     'depth': depth,
-                    'priority': type_priority.get('pillar', 3),
+                    'priority': P_PILLAR,
                     'x': pillar_x,
                     'width': pillar_visible_width,
                     'height': pillar_height,
                     'z': wall_z,
-                    'openings': [],
+                    'openings': NO_OPENINGS,
                     'coord_key': None  # Pillars don't have openings
                 })
 
         # Step 2: Sort objects by depth (back to front), then by priority
-        # Priority ensures correct layering when objects have same depth
-        objects_to_draw.sort(key=lambda w: (w['depth'], w.get('priority', 2)))
-
-        # DEBUG: Save objects_to_draw to JSON for examination
-        import json
-        debug_data = {
-            'view_type': view_type,
-            'floor_number': floor_num,
-            'current_z': current_z,
-            'objects': []
-        }
-        for obj in objects_to_draw:
-            # Create a JSON-serializable copy
-            obj_copy = {
-                'type': obj.get('type', 'unknown'),
-                'name': obj.get('name', 'unnamed'),
-                'depth': obj['depth'],
-                'priority': obj.get('priority', 2),
-                'x': obj['x'],
-                'width': obj['width'],
-                'height': obj['height'],
-                'z': obj['z'],
-                'height_end': obj.get('height_end'),
-                'coord_key': obj.get('coord_key'),
-                'num_openings': len(obj.get('openings', [])),
-                'openings': []
+        # Priority ensures correct layering when objects have same depth.
+        # Kept per floor: the debug dump reads this order, and it orders
+        # equal-key records within the floor for the global sort.
+        objects_to_draw.sort(key=draw_order)
+
+        # DEBUG: Save objects_to_draw to JSON for examination (opt-in)
+        if debug_dump_dir is not None:
+            debug_data = {
+                'view_type': view_type,
+                'floor_number': floor_num,
+                'current_z': current_z,
+                'objects': []
             }
-            # Add opening details for walls
-            for opening in obj.get('openings', []):
-                obj_copy['openings'].append({
-                    'type': opening.get('type'),
-                    'wall': obj.get('name', 'unnamed'),  # The wall this opening is associated with
-                    'x': opening.get('x'),
-                    'y': opening.get('y'),
-                    'width': opening['width'],
-                    'height': opening['height'],
-                    'room': opening.get('room'),
-                    'direction': opening.get('direction'),
-                    'sill_height': opening.get('sill_height')
-                })
-            debug_data['objects'].append(obj_copy)
+            for obj in objects_to_draw:
+                # Create a JSON-serializable copy
+                obj_copy = {
+                    'type': obj.get('type', 'unknown'),
+                    'name': obj.get('name', 'unnamed'),
+                    'depth': obj['depth'],
+                    'priority': obj.get('priority', 2),
+                    'x': obj['x'],
+                    'width': obj['width'],
+                    'height': obj['height'],
+                    'z': obj['z'],
+                    'height_end': obj.get('height_end'),
+                    'coord_key': obj.get('coord_key'),
+                    'num_openings': len(obj.get('openings', [])),
+                    'openings': []
+                }
+                # Add opening details for walls
+                for opening in obj.get('openings', []):
+                    obj_copy['openings'].append({
+                        'type': opening.get('type'),
+                        'wall': obj.get('name', 'unnamed'),  # The wall this opening is associated with
+                        'x': opening.get('x'),
+                        'y': opening.get('y'),
+                        'width': opening['width'],
+                        'height': opening['height'],
+                        'room': opening.get('room'),
+                        'direction': opening.get('direction'),
+                        'sill_height': opening.get('sill_height')
+                    })
+                debug_data['objects'].append(obj_copy)
 
-        # Save to the same folder as the SVG. When output_path is None
-        # (elevation being composed into a combined view) skip — otherwise
-        # every combined-elevation run scatters ~12 debug JSONs into cwd.
-        if output_path:
             try:
-                import os
-                debug_file = os.path.join(os.path.dirname(output_path), f'objects_debug_{view_type}_floor{floor_num}.json')
+                debug_file = os.path.join(debug_dump_dir, f'objects_debug_{view_type}_floor{floor_num}.json')
                 with open(debug_file, 'w') as f:
                     json.dump(debug_data, f, indent=2)
                 print(f"  DEBUG: Saved objects data to {debug_file}")
@@ -2173,8 +2227,6 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
         if 'objects' in floor_config:
             for obj in floor_config['objects']:
                 if obj.get('type') == 'gable_roof':
-                    import math
-
                     ridge_axis = obj.get('ridge_axis', 'x')
                     ridge_z_relative = obj.get('ridge_z', 0)
                     ridge_start_x = obj.get('ridge_start_x', 0)
@@ -2188,10 +2240,8 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
 
                     ridge_z = current_z + ridge_z_relative
 
-                    left_horizontal = left_slope_length * math.cos(math.radians(left_slope_angle))
-                    left_drop = left_slope_length * math.sin(math.radians(left_slope_angle))
-                    right_horizontal = right_slope_length * math.cos(math.radians(right_slope_angle))
-                    right_drop = right_slope_length * math.sin(math.radians(right_slope_angle))
+                    left_horizontal, left_drop, right_horizontal, right_drop = _gable_slope_extents(
+                        left_slope_angle, left_slope_length, right_slope_angle, right_slope_length)
 
                     left_eave_z = ridge_z - left_drop
                     right_eave_z = ridge_z - right_drop
@@ -2223,8 +2273,8 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                         left_eave_svg_x = world_to_svg_x(tri_left_world, 0)
                         right_eave_svg_x = world_to_svg_x(tri_right_world, 0)
 
-                        roof_svg += f'<line x1="{left_eave_svg_x}" y1="{left_eave_svg_y}" x2="{ridge_svg_x}" y2="{ridge_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
-                        roof_svg += f'<line x1="{ridge_svg_x}" y1="{ridge_svg_y}" x2="{right_eave_svg_x}" y2="{right_eave_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
+                        roof_parts.append(f'<line x1="{left_eave_svg_x}" y1="{left_eave_svg_y}" x2="{ridge_svg_x}" y2="{ridge_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
+                        roof_parts.append(f'<line x1="{ridge_svg_x}" y1="{ridge_svg_y}" x2="{right_eave_svg_x}" y2="{right_eave_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
                     else:
                         # Side view (looking parallel to ridge): see one full slope as a rectangle.
                         # Pick which slope faces the viewer.
@@ -2244,11 +2294,10 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                         roof_width = abs(ridge_end_svg_x - ridge_start_svg_x)
                         roof_height = roof_bottom_y - ridge_bottom_y
 
-                        roof_svg += f'<rect x="{min(ridge_start_svg_x, ridge_end_svg_x)}" y="{ridge_bottom_y}" width="{roof_width}" height="{roof_height}" fill="none" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
-                        roof_svg += f'<line x1="{ridge_start_svg_x}" y1="{ridge_top_y}" x2="{ridge_end_svg_x}" y2="{ridge_top_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
+                        roof_parts.append(f'<rect x="{min(ridge_start_svg_x, ridge_end_svg_x)}" y="{ridge_bottom_y}" width="{roof_width}" height="{roof_height}" fill="none" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
+                        roof_parts.append(f'<line x1="{ridge_start_svg_x}" y1="{ridge_top_y}" x2="{ridge_end_svg_x}" y2="{ridge_top_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
 
                 if obj.get('type') == 'hip_roof':
-                    import math
                     ridge_axis_h = obj.get('ridge_axis', 'y')
                     eave_xw = obj['eave_x_west']
                     eave_xe = obj['eave_x_east']
@@ -2341,8 +2390,8 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                         eave_svg_y = z_to_y(eave_z_abs)
                         apex_svg_y = z_to_y(ridge_top_z)
                         # Two slope edges
-                        roof_svg += f'<line x1="{eave_low_svg_x}" y1="{eave_svg_y}" x2="{apex_svg_x}" y2="{apex_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
-                        roof_svg += f'<line x1="{apex_svg_x}" y1="{apex_svg_y}" x2="{eave_high_svg_x}" y2="{eave_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
+                        roof_parts.append(f'<line x1="{eave_low_svg_x}" y1="{eave_svg_y}" x2="{apex_svg_x}" y2="{apex_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
+                        roof_parts.append(f'<line x1="{apex_svg_x}" y1="{apex_svg_y}" x2="{eave_high_svg_x}" y2="{eave_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
                     else:
                         # Trapezoid: eave edge at bottom, ridge edge at top, two slanted sides
                         eave_low_svg_x = world_to_svg_x(trap_eave_low, 0)
@@ -2353,8 +2402,8 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                         ridge_svg_y = z_to_y(ridge_top_z)
                         # Two slanted sides (eave corner to ridge corner —
                         # still at the ORIGINAL hip apex R1 / R2)
-                        roof_svg += f'<line x1="{eave_low_svg_x}" y1="{eave_svg_y}" x2="{ridge_low_svg_x}" y2="{ridge_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
-                        roof_svg += f'<line x1="{ridge_high_svg_x}" y1="{ridge_svg_y}" x2="{eave_high_svg_x}" y2="{eave_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
+                        roof_parts.append(f'<line x1="{eave_low_svg_x}" y1="{eave_svg_y}" x2="{ridge_low_svg_x}" y2="{ridge_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
+                        roof_parts.append(f'<line x1="{ridge_high_svg_x}" y1="{ridge_svg_y}" x2="{eave_high_svg_x}" y2="{eave_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
                         # Ridge line at top — extended past R1 / R2 when the
                         # optional ridge-end ventilation feature is on.
                         vent_ext_u = float(obj.get('ridge_ext_u', 0.0))
@@ -2375,121 +2424,124 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                             # Horizontal caps sticking out past R1 and R2 —
                             # drawn a touch heavier so they read as
                             # continuous with the main ridge line.
-                            roof_svg += f'<line x1="{ext_low_svg_x}" y1="{ridge_svg_y}" x2="{ext_high_svg_x}" y2="{ridge_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
+                            roof_parts.append(f'<line x1="{ext_low_svg_x}" y1="{ridge_svg_y}" x2="{ext_high_svg_x}" y2="{ridge_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
                             # Tiny vertical drop tick at each extension end
                             # so the reader can distinguish the cap from
                             # a lengthened pyramid ridge at a glance.
                             _tick = max(4, roof_thickness_val * 1.5)
-                            roof_svg += f'<line x1="{ext_low_svg_x}" y1="{ridge_svg_y}" x2="{ext_low_svg_x}" y2="{ridge_svg_y + _tick}" stroke="#8B4513" stroke-width="{roof_thickness_val * 0.8}"/>\n'
-                            roof_svg += f'<line x1="{ext_high_svg_x}" y1="{ridge_svg_y}" x2="{ext_high_svg_x}" y2="{ridge_svg_y + _tick}" stroke="#8B4513" stroke-width="{roof_thickness_val * 0.8}"/>\n'
+                            roof_parts.append(f'<line x1="{ext_low_svg_x}" y1="{ridge_svg_y}" x2="{ext_low_svg_x}" y2="{ridge_svg_y + _tick}" stroke="#8B4513" stroke-width="{roof_thickness_val * 0.8}"/>\n')
+                            roof_parts.append(f'<line x1="{ext_high_svg_x}" y1="{ridge_svg_y}" x2="{ext_high_svg_x}" y2="{ridge_svg_y + _tick}" stroke="#8B4513" stroke-width="{roof_thickness_val * 0.8}"/>\n')
                         else:
                             # Plain ridge (no vent)
-                            roof_svg += f'<line x1="{ridge_low_svg_x}" y1="{ridge_svg_y}" x2="{ridge_high_svg_x}" y2="{ridge_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n'
+                            roof_parts.append(f'<line x1="{ridge_low_svg_x}" y1="{ridge_svg_y}" x2="{ridge_high_svg_x}" y2="{ridge_svg_y}" stroke="#8B4513" stroke-width="{roof_thickness_val}"/>\n')
 
         current_z = wall_top
 
     # AFTER ALL FLOORS: Sort all objects globally and draw them
     # Sort by depth (back to front), then by priority (for same depth)
-    all_objects_to_draw.sort(key=lambda w: (w['depth'], w.get('priority', 2)))
+    all_objects_to_draw.sort(key=draw_order)
 
     # Find the MAXIMUM depth among walls (front-most walls only)
     # Objects are sorted by depth: smaller=back, larger=front
-    # So maximum depth = closest to viewer = walls we want to dimension
-    wall_depths = [obj['depth'] for obj in all_objects_to_draw if obj.get('type') == 'wall']
-    max_wall_depth = max(wall_depths) if wall_depths else float('-inf')
+    # So maximum depth = closest to viewer = walls we want to dimension,
+    # i.e. the depth of the last wall in the sorted list
+    max_wall_depth = float('-inf')
+    for obj in reversed(all_objects_to_draw):
+        if obj['type'] == 'wall':
+            max_wall_depth = obj['depth']
+            break
     depth_tolerance = 5.0  # Consider walls within this depth range as "front-most"
 
     # Draw each object in global depth order
     for obj in all_objects_to_draw:
-        obj_type = obj.get('type')
+        obj_type = obj['type']
         obj_x_world = obj['x']  # World X coordinate
         obj_z = obj['z']  # World Z coordinate (bottom of object)
         obj_width = obj['width']
         obj_height = obj['height']
 
-        # Convert world coordinates to SVG coordinates
-        obj_x = world_to_svg_x(obj_x_world, obj_width)  # Convert X with mirroring
-        obj_bottom_y = z_to_y(obj_z)
-        obj_top_y = z_to_y(obj_z + obj_height)
+        # Convert world coordinates to SVG coordinates (world_to_svg_x and
+        # z_to_y inlined: this runs for every object in the view)
+        obj_x = width - (obj_x_world + obj_width) if mirrored_view else obj_x_world
+        obj_bottom_y = total_height - obj_z
+        obj_top_y = total_height - (obj_z + obj_height)
         obj_svg_height = obj_bottom_y - obj_top_y
 
         if obj_type == 'floor_slab':
             # Draw floor slab
-            fill_color = obj.get('fill', '#808080')
-            svg += f'<rect x="{obj_x}" y="{obj_top_y}" width="{obj_width}" height="{obj_svg_height}" fill="{fill_color}" stroke="#000" stroke-width="0.5"/>\n'
+            write(_ELEV_RECT(obj_x, obj_top_y, obj_width, obj_svg_height, obj['fill']))
 
         elif obj_type == 'beam':
             # Draw beam
-            fill_color = obj.get('fill', '#654321')
-            svg += f'<rect x="{obj_x}" y="{obj_top_y}" width="{obj_width}" height="{obj_svg_height}" fill="{fill_color}" stroke="#000" stroke-width="0.5"/>\n'
+            write(_ELEV_RECT(obj_x, obj_top_y, obj_width, obj_svg_height, obj['fill']))
 
         elif obj_type == 'staircase':
             # Draw staircase with steps in elevation view
             num_steps = obj.get('num_steps', 10)
-            fill_color = obj.get('fill', '#C19A6B')
+            if num_steps == 0:
+                # No steps to divide the flight by
+                continue
+            fill_color = obj['fill']
 
             # Draw individual steps (risers and treads)
             tread_run = obj_width / num_steps  # Horizontal depth of each tread
             riser_height = obj_svg_height / num_steps  # Vertical height of each riser
 
-            svg += '<g class="staircase-elevation">\n'
+            # Each step is a riser (vertical line), a tread (horizontal
+            # line) and a filled rect; all steps go out in a single write
+            step_parts = ['<g class="staircase-elevation">\n']
             for i in range(num_steps):
                 step_x = obj_x + i * tread_run
                 step_bottom_y = obj_bottom_y - i * riser_height
                 step_top_y = step_bottom_y - riser_height
 
-                # Draw riser (vertical)
-                svg += f'<line x1="{step_x}" y1="{step_bottom_y}" x2="{step_x}" y2="{step_top_y}" stroke="#000" stroke-width="0.5"/>\n'
-
-                # Draw tread (horizontal)
-                svg += f'<line x1="{step_x}" y1="{step_top_y}" x2="{step_x + tread_run}" y2="{step_top_y}" stroke="#000" stroke-width="0.5"/>\n'
-
-                # Fill the step
-                svg += f'<rect x="{step_x}" y="{step_top_y}" width="{tread_run}" height="{riser_height}" fill="{fill_color}" opacity="0.7"/>\n'
+                step_parts.append(_ELEV_STAIR_STEP(
+                    step_x, step_bottom_y, step_top_y, step_x + tread_run,
+                    tread_run, riser_height, fill_color))
+            write(''.join(step_parts))
 
             # Close the staircase outline
             last_step_x = obj_x + num_steps * tread_run
-            svg += f'<line x1="{last_step_x}" y1="{obj_top_y}" x2="{last_step_x}" y2="{obj_bottom_y}" stroke="#000" stroke-width="0.5"/>\n'
-            svg += f'<line x1="{obj_x}" y1="{obj_bottom_y}" x2="{last_step_x}" y2="{obj_bottom_y}" stroke="#000" stroke-width="0.5"/>\n'
-            svg += '</g>\n'
+            write(_ELEV_LINE(last_step_x, obj_top_y, last_step_x, obj_bottom_y))
+            write(_ELEV_LINE(obj_x, obj_bottom_y, last_step_x, obj_bottom_y))
+            write('</g>\n')
 
         elif obj_type == 'pillar':
             # Draw pillar as solid black rectangle
-            svg += f'<rect x="{obj_x}" y="{obj_top_y}" width="{obj_width}" height="{obj_svg_height}" fill="#000" stroke="#000" stroke-width="0.5"/>\n'
+            write(_ELEV_RECT(obj_x, obj_top_y, obj_width, obj_svg_height, '#000'))
 
         elif obj_type == 'wall':
             # Draw the wall
             # Check if this is a sloping wall (has different height at start vs end)
-            # Must explicitly check that height_end key exists AND is different from height
+            # Must explicitly check that height_end is present (not None) AND differs from height
             # Note: height_end can be 0 (valid for walls that slope down to nothing)
-            has_height_end = 'height_end' in obj
-            height_end_value = obj.get('height_end') if has_height_end else None
-            is_sloping = has_height_end and (height_end_value is not None) and (obj_height != height_end_value)
+            height_end_value = obj.get('height_end')
+            is_sloping = height_end_value is not None and obj_height != height_end_value
 
             if is_sloping:
                 # Sloping wall - convert all four corners
                 # For mirrored views (front, right), swap the heights since we're reversing the wall direction
-                if view_type in ['front', 'right']:
+                if mirrored_view:
                     # Swap heights for mirrored views
-                    h_left = obj['height_end']  # What was on right is now on left
+                    h_left = height_end_value   # What was on right is now on left
                     h_right = obj_height        # What was on left is now on right
                 else:
                     # No mirroring, use original heights
                     h_left = obj_height
-                    h_right = obj['height_end']
+                    h_right = height_end_value
 
                 # Four corners: bottom-left, top-left, top-right, bottom-right
-                bl_y = z_to_y(obj_z)
-                tl_y = z_to_y(obj_z + h_left)
-                tr_y = z_to_y(obj_z + h_right)
-                br_y = z_to_y(obj_z)
+                # (both bottom corners sit at the already-converted obj_bottom_y)
+                bl_y = br_y = obj_bottom_y
+                tl_y = total_height - (obj_z + h_left)
+                tr_y = total_height - (obj_z + h_right)
                 # For polygons, we need to convert each X coordinate separately
                 x_left = obj_x
                 x_right = obj_x + obj_width
-                svg += f'<polygon points="{x_left},{bl_y} {x_left},{tl_y} {x_right},{tr_y} {x_right},{br_y}" fill="#C19A6B" stroke="#000" stroke-width="0.5"/>\n'
+                write(f'<polygon points="{x_left},{bl_y} {x_left},{tl_y} {x_right},{tr_y} {x_right},{br_y}" fill="#C19A6B" stroke="#000" stroke-width="0.5"/>\n')
             else:
                 # Regular wall
-                svg += f'<rect x="{obj_x}" y="{obj_top_y}" width="{obj_width}" height="{obj_svg_height}" fill="#C19A6B" stroke="#000" stroke-width="0.5"/>\n'
+                write(_ELEV_RECT(obj_x, obj_top_y, obj_width, obj_svg_height, '#C19A6B'))
 
             # Check if this wall is at the front (for dimensioning)
             # Front walls have depth close to the maximum (closest to viewer)
@@ -2510,28 +2562,33 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                 # Only show dimensions if at least one height differs from expected
                 # This excludes sloping walls that slope within the normal floor height range
                 if has_custom_height or has_custom_height_end:
-                    walls_with_custom_heights.append({
-                        'name': obj.get('name', ''),
-                        'x': obj_x_world,
-                        'width': obj_width,
-                        'z': obj_z,
-                        'height_start': actual_height,
-                        'height_end': height_end,
-                        'is_sloping': is_sloping,
-                        'expected_height': expected_height
-                    })
+                    height_range = (min(actual_height, height_end), max(actual_height, height_end))
+                    if height_range not in walls_with_custom_heights:
+                        walls_with_custom_heights[height_range] = {
+                            'name': obj.get('name', ''),
+                            'x': obj_x_world,
+                            'width': obj_width,
+                            'z': obj_z,
+                            'height_start': actual_height,
+                            'height_end': height_end,
+                            'is_sloping': is_sloping,
+                            'expected_height': expected_height
+                        }
 
             # Draw openings for this wall
-            for opening in obj.get('openings', []):
+            # Get the correct coordinate based on view direction
+            coord_key = obj['coord_key']
+            faces_viewer = obj.get('faces_viewer')
+            wall_name = obj.get('name', '')
+            opening_parts = []
+            for opening in obj['openings']:
                 opening_type = opening.get('type')
                 opening_width = opening['width']
                 opening_height = opening['height']
-                # Get the correct coordinate based on view direction
-                coord_key = obj['coord_key']
                 opening_x_world = opening.get(coord_key, 0)
 
                 # Convert opening X coordinate with mirroring
-                opening_x = world_to_svg_x(opening_x_world, opening_width)
+                opening_x = width - (opening_x_world + opening_width) if mirrored_view else opening_x_world
 
                 # Calculate opening position in world Z
                 if opening_type == 'window':
@@ -2541,17 +2598,17 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                     opening_z_bottom = obj_z
 
                 # Convert to SVG Y coordinates
-                opening_svg_bottom_y = z_to_y(opening_z_bottom)
-                opening_svg_top_y = z_to_y(opening_z_bottom + opening_height)
+                opening_svg_bottom_y = total_height - opening_z_bottom
+                opening_svg_top_y = total_height - (opening_z_bottom + opening_height)
                 opening_svg_height = opening_svg_bottom_y - opening_svg_top_y
 
                 fill_color = "#87CEEB" if opening_type == 'window' else "#D2691E"
-                svg += f'<rect x="{opening_x}" y="{opening_svg_top_y}" width="{opening_width}" height="{opening_svg_height}" fill="{fill_color}" stroke="#000" stroke-width="0.5"/>\n'
+                opening_parts.append(_ELEV_RECT(opening_x, opening_svg_top_y, opening_width, opening_svg_height, fill_color))
 
                 # Collect every viewer-facing window for sill dimensioning,
                 # not just the front-most wall — so set-back windows (e.g.
                 # bedroom windows behind a verandah) still get a sill callout.
-                if opening_type == 'window' and obj.get('faces_viewer'):
+                if opening_type == 'window' and faces_viewer:
                     sill_windows.append({
                         'x': opening_x_world,
                         'width': opening_width,
@@ -2561,7 +2618,7 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
 
                 # Track opening for dimensioning ONLY if it's on a front-most wall
                 if is_front_wall:
-                    elevation_openings.append({
+                    elevation_openings[wall_name].append({
                         'type': opening_type,
                         'x': opening_x_world,  # Store world X for dimension calculation
                         'z_bottom': opening_z_bottom,  # World Z coordinate
@@ -2569,19 +2626,19 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                         'height': opening_height,
                         'sill_height': opening.get('sill_height', 0) if opening_type == 'window' else 0,
                         'wall_start': obj_x_world,  # Wall start position for calculating offsets
-                        'wall_width': obj_width,    # Wall width
-                        'wall_name': obj.get('name', '')  # Wall name for grouping
+                        'wall_width': obj_width     # Wall width
                     })
+            if opening_parts:
+                write(''.join(opening_parts))
 
     # Draw roof last so it's not hidden by walls
-    svg += roof_svg
+    write(''.join(roof_parts))
 
     # ====================================================================
     # ADD DIMENSIONS TO ELEVATION
     # ====================================================================
 
-    dim_config = GLOBAL_CONFIG.get('dimensions', {})
-    if dim_config.get('show_outer_dimensions', True):
+    if show_outer_dimensions:
         base_offset = 30
         offset_increment = 20
 
@@ -2598,44 +2655,28 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                 # z_bottom is top of slab, z_top is top of walls
                 y_bottom = z_to_y(level['z_bottom'])
                 y_top = z_to_y(level['z_top'])
-                svg += svg_draw_dimension_line(
+                write(svg_draw_dimension_line(
                     width, y_bottom,
                     width, y_top,
-                    right_offset,
-                    is_horizontal=False,
-                    adjust_start=False,
-                    adjust_end=False
-                )
+                    right_offset, is_horizontal=False
+                ))
 
         # 2. TOP: Overall width
         # Draw overall width dimension at the top (at the highest point)
         top_y = z_to_y(total_height)
         top_offset = -base_offset
-        svg += svg_draw_dimension_line(
+        write(svg_draw_dimension_line(
             0, top_y,
             width, top_y,
-            top_offset,
-            is_horizontal=True,
-            adjust_start=False,
-            adjust_end=False
-        )
+            top_offset, is_horizontal=True
+        ))
 
         # 3. OPENING DIMENSIONS: Show offsets and gaps like floor plans
-        # Group openings by wall name only (not z_bottom, so doors and windows are together)
+        # Openings are already grouped by wall name only (not z_bottom, so
+        # doors and windows are together)
         if elevation_openings:
-            # Group openings by wall name only
-            wall_groups = {}
-            for opening in elevation_openings:
-                wall_key = opening['wall_name']
-                if wall_key not in wall_groups:
-                    wall_groups[wall_key] = []
-                wall_groups[wall_key].append(opening)
-
             # Process each wall group separately
-            for wall_key, wall_openings in wall_groups.items():
-                if not wall_openings:
-                    continue
-
+            for wall_openings in elevation_openings.values():
                 # Sort openings by x position along the wall
                 sorted_openings = sorted(wall_openings, key=lambda o: o['x'])
 
@@ -2655,36 +2696,30 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                 # Draw dimensions: offset to first, then gaps and widths
                 current_pos = wall_start
 
-                for i, opening in enumerate(sorted_openings):
+                for opening in sorted_openings:
                     opening_start = opening['x']
-                    opening_end = opening['x'] + opening['width']
+                    opening_width = opening['width']
+                    opening_end = opening_start + opening_width
 
                     # Dimension from current position to opening start (offset or gap)
                     if opening_start > current_pos:
-                        gap = opening_start - current_pos
                         # Convert to SVG coordinates with mirroring
                         start_svg = world_to_svg_x(current_pos, 0)
                         end_svg = world_to_svg_x(opening_start, 0)
 
-                        svg += svg_draw_dimension_line(
+                        write(svg_draw_dimension_line(
                             min(start_svg, end_svg), opening_y,
                             max(start_svg, end_svg), opening_y,
-                            offset,
-                            is_horizontal=True,
-                            adjust_start=False,
-                            adjust_end=False
-                        )
+                            offset, is_horizontal=True
+                        ))
 
                     # Dimension for opening width
-                    opening_start_svg = world_to_svg_x(opening_start, opening['width'])
-                    svg += svg_draw_dimension_line(
+                    opening_start_svg = world_to_svg_x(opening_start, opening_width)
+                    write(svg_draw_dimension_line(
                         opening_start_svg, opening_y,
-                        opening_start_svg + opening['width'], opening_y,
-                        offset,
-                        is_horizontal=True,
-                        adjust_start=False,
-                        adjust_end=False
-                    )
+                        opening_start_svg + opening_width, opening_y,
+                        offset, is_horizontal=True
+                    ))
 
                     current_pos = opening_end
 
@@ -2694,11 +2729,8 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
             # Position these dimensions on the left side
             left_offset = -base_offset
 
-            # Track which height ranges we've already dimensioned to avoid duplicates
-            # (e.g., two walls with heights 0→47 and 47→0 have the same range)
-            dimensioned_height_ranges = set()
-
-            for wall in walls_with_custom_heights:
+            # One wall per height range (deduplicated as walls were drawn)
+            for wall in walls_with_custom_heights.values():
                 wall_x_world = wall['x']
                 wall_width = wall['width']
                 wall_z = wall['z']
@@ -2706,15 +2738,6 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                 height_end = wall['height_end']
                 is_sloping = wall['is_sloping']
 
-                # Create a normalized height range key (min to max) to detect duplicates
-                height_range = (min(height_start, height_end), max(height_start, height_end))
-
-                # Skip if we've already dimensioned this height range
-                if height_range in dimensioned_height_ranges:
-                    continue
-
-                dimensioned_height_ranges.add(height_range)
-
                 # Convert world coordinates to SVG
                 wall_x_svg = world_to_svg_x(wall_x_world, wall_width)
                 wall_bottom_y = z_to_y(wall_z)
@@ -2722,7 +2745,7 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
                 if is_sloping:
                     # For sloping walls, show dimensions at both ends
                     # Handle mirroring for front/right views
-                    if view_type in ['front', 'right']:
+                    if mirrored_view:
                         # Heights are swapped for mirrored views
                         h_left = height_end
                         h_right = height_start
@@ -2732,37 +2755,28 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
 
                     # Left edge dimension
                     wall_top_left_y = z_to_y(wall_z + h_left)
-                    svg += svg_draw_dimension_line(
+                    write(svg_draw_dimension_line(
                         wall_x_svg, wall_bottom_y,
                         wall_x_svg, wall_top_left_y,
-                        left_offset,
-                        is_horizontal=False,
-                        adjust_start=False,
-                        adjust_end=False
-                    )
+                        left_offset, is_horizontal=False
+                    ))
 
                     # Right edge dimension
                     wall_top_right_y = z_to_y(wall_z + h_right)
-                    svg += svg_draw_dimension_line(
+                    write(svg_draw_dimension_line(
                         wall_x_svg + wall_width, wall_bottom_y,
                         wall_x_svg + wall_width, wall_top_right_y,
-                        left_offset,
-                        is_horizontal=False,
-                        adjust_start=False,
-                        adjust_end=False
-                    )
+                        left_offset, is_horizontal=False
+                    ))
                 else:
                     # Non-sloping wall with custom height - dimension in the middle
                     wall_top_y = z_to_y(wall_z + height_start)
                     wall_mid_x = wall_x_svg + wall_width / 2
-                    svg += svg_draw_dimension_line(
+                    write(svg_draw_dimension_line(
                         wall_mid_x, wall_bottom_y,
                         wall_mid_x, wall_top_y,
-                        left_offset,
-                        is_horizontal=False,
-                        adjust_start=False,
-                        adjust_end=False
-                    )
+                        left_offset, is_horizontal=False
+                    ))
 
         # 5. WINDOW SILL HEIGHTS: explicit vertical dimension from each
         # window's floor datum up to its sill, so the sill height is never
@@ -2775,22 +2789,35 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
             sill_x_svg = world_to_svg_x(w['x'], w['width'])
             sill_floor_y = z_to_y(w['z_bottom'] - w['sill_height'])
             sill_top_y = z_to_y(w['z_bottom'])
-            svg += svg_draw_dimension_line(
+            write(svg_draw_dimension_line(
                 sill_x_svg, sill_floor_y,
                 sill_x_svg, sill_top_y,
-                sill_offset,
-                is_horizontal=False,
-                adjust_start=False,
-                adjust_end=False
-            )
+                sill_offset, is_horizontal=False
+            ))
 
-    svg += '''</g>
-'''
+    # Close the drawing group, then the title and the document
+    content_end = buf.tell()
+    write('</g>\n' + title_svg + '</svg>')
 
-    # Add title in the title space area (vertically centered in the title_space)
-    title_y = title_space / 2 + 10  # Centered in title space, slightly offset
-    svg += f'<text x="{svg_width/2}" y="{title_y}" text-anchor="middle" font-size="18" font-weight="bold" fill="#333">{view_name}</text>\n'
-    svg += '</svg>'
+    return buf.getvalue(), _drawing_info(horizontal_margin, content_top_margin,
+                                         svg_width, svg_height,
+                                         content_start, content_end)
+
+
+def generate_elevation_view(house_config: dict, view_type: str, output_path: str = None, scale: float = 2.0) -> str:
+    """
+    Generate an SVG elevation view (front, back, left, right) from house configuration.
+
+    Args:
+        house_config: Complete house configuration
+        view_type: 'front', 'back', 'left', or 'right'
+        output_path: Path to save SVG file (if None, returns SVG string only)
+        scale: SVG scaling factor
+
+    Returns:
+        SVG string
+    """
+    svg, _ = _render_elevation_view(house_config, view_type, output_path, scale)
 
     # Save to file if path provided
     if output_path:
@@ -2801,35 +2828,49 @@ def generate_elevation_view(house_config: dict, view_type: str, output_path: str
     return svg
 
 
-def generate_all_elevations(house_config: dict, output_dir: str = None):
+def _resolve_output_dir(output_dir: str = None) -> str:
     """
-    Generate SVG elevation views (front, back, left, right) for the house.
+    Return the directory to write 2D drawings to, creating it if needed.
 
-    Args:
-        house_config: Complete house configuration
-        output_dir: Directory to save SVG files (defaults to docs folder for web deployment)
+    Defaults to the docs folder (for web deployment) next to the saved
+    .blend file when running in Blender, or in the current directory.
     """
-    import os
-    from house_expand import expand_room_walls
-    house_config = expand_room_walls(house_config)
-
     if output_dir is None:
-        # Get the blend file directory (if running in Blender) or use current directory
         try:
             import bpy
             blend_filepath = bpy.data.filepath
-            if blend_filepath:
-                blend_dir = os.path.dirname(blend_filepath)
-            else:
-                blend_dir = os.getcwd()
+            blend_dir = os.path.dirname(blend_filepath) if blend_filepath else os.getcwd()
         except ImportError:
             # Not running in Blender, use current directory
             blend_dir = os.getcwd()
-
-        # Save to docs folder for web deployment
         output_dir = os.path.join(blend_dir, "docs")
 
     os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+
+def _open_svg_output(output_path: str, compress: bool = False):
+    """
+    Open an SVG output file for writing text, gzip-compressed (for a
+    .svgz path) when compress is set.
+    """
+    if compress:
+        return gzip.open(output_path, 'wt', encoding='utf-8', compresslevel=6)
+    return open(output_path, 'w', encoding='utf-8')
+
+
+def generate_all_elevations(house_config: dict, output_dir: str = None):
+    """
+    Generate SVG elevation views (front, back, left, right) for the house.
+
+    Args:
+        house_config: Complete house configuration
+        output_dir: Directory to save SVG files (defaults to docs folder for web deployment)
+    """
+    from house_expand import expand_room_walls
+    house_config = expand_room_walls(house_config)
+
+    output_dir = _resolve_output_dir(output_dir)
 
     print("\n" + "="*70)
     print("GENERATING ELEVATION VIEWS (SVG)")
@@ -3126,7 +3167,10 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
 
     content_top = top_margin + title_space
 
-    svg = (
+    buf = io.StringIO()
+    write = buf.write
+
+    write(
         '<?xml version="1.0" encoding="UTF-8"?>\n'
         f'<svg xmlns="http://www.w3.org/2000/svg" width="{svg_width}" '
         f'height="{svg_height}" viewBox="0 0 {svg_width} {svg_height}">\n'
@@ -3143,7 +3187,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
     )
 
     # Key plan (top right)
-    svg += _build_key_plan_svg(
+    write(_build_key_plan_svg(
         all_pillars or pillars_to_show,
         pillars_to_show,
         building_width, building_length,
@@ -3151,22 +3195,22 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
         inset_origin_x=svg_width - key_plan_size - key_plan_margin,
         inset_origin_y=key_plan_margin,
         inset_size=key_plan_size,
-    )
+    ))
 
-    svg += (
+    write(
         f'<g transform="translate({horizontal_margin}, {content_top}) '
         f'scale({scale})">\n'
     )
 
     # Ground line
     ground_y = z_to_y(0)
-    svg += (
+    write(
         f'<line x1="0" y1="{ground_y}" x2="{view_extent}" y2="{ground_y}" '
         'stroke="#666" stroke-width="2" stroke-dasharray="5,5"/>\n'
     )
 
     # Plinth band
-    svg += (
+    write(
         f'<rect x="0" y="{z_to_y(z_plinth_top)}" width="{view_extent}" '
         f'height="{plinth_height}" fill="#A0826D" stroke="#000" '
         'stroke-width="0.5"/>\n'
@@ -3175,7 +3219,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
     # Ground-floor slab band
     for slab in floor0_slabs:
         sx, sw = _project_slab_band(slab, view_type, building_width, building_length)
-        svg += (
+        write(
             f'<rect x="{sx}" y="{z_to_y(z_floor0_slab_top)}" width="{sw}" '
             f'height="{slab_thickness}" fill="#808080" stroke="#000" '
             'stroke-width="0.5"/>\n'
@@ -3183,7 +3227,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
 
     # Pillars
     for r in rendered:
-        svg += (
+        write(
             f'<rect x="{r["proj_x"]}" y="{z_to_y(r["z_top"])}" '
             f'width="{r["visible_w"]}" '
             f'height="{r["z_top"] - r["z_bottom"]}" '
@@ -3193,7 +3237,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
     # Floor-1 slab on top of pillars
     for slab in floor1_slabs:
         sx, sw = _project_slab_band(slab, view_type, building_width, building_length)
-        svg += (
+        write(
             f'<rect x="{sx}" y="{z_to_y(z_floor1_slab_top)}" width="{sw}" '
             f'height="{slab_thickness}" fill="url(#slab_hatch)" stroke="#000" '
             'stroke-width="0.6"/>\n'
@@ -3206,7 +3250,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
             seg_b = r['z_top'] - z_floor1_slab_top
             mid_z = (z_floor1_slab_top + r['z_top']) / 2
             cx = r['proj_x'] + r['visible_w'] / 2
-            svg += (
+            write(
                 f'<text x="{cx}" y="{z_to_y(mid_z)}" text-anchor="middle" '
                 f'font-size="{text_size}" fill="#000" '
                 f'transform="rotate(-90 {cx} {z_to_y(mid_z)})">'
@@ -3216,7 +3260,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
             seg_a = r['z_top'] - r['z_bottom']
             mid_z = (r['z_bottom'] + r['z_top']) / 2
             cx = r['proj_x'] + r['visible_w'] / 2
-            svg += (
+            write(
                 f'<text x="{cx}" y="{z_to_y(mid_z)}" text-anchor="middle" '
                 f'font-size="{text_size}" fill="#000" '
                 f'transform="rotate(-90 {cx} {z_to_y(mid_z)})">'
@@ -3230,7 +3274,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
         name = r['name'].replace('_', ' ') if r['name'] else ''
         if not name:
             continue
-        svg += (
+        write(
             f'<text x="{cx}" y="{label_anchor_y}" text-anchor="end" '
             f'font-size="3.5" fill="#000" '
             f'transform="rotate(-90 {cx} {label_anchor_y})">{name}</text>\n'
@@ -3247,7 +3291,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
     for z_lo, z_hi in dim_levels:
         y_lo = z_to_y(z_lo)
         y_hi = z_to_y(z_hi)
-        svg += (
+        write(
             f'<line x1="0" y1="{y_lo}" x2="{dim_x}" y2="{y_lo}" '
             'stroke="#000" stroke-width="0.3" stroke-dasharray="2,2"/>\n'
             f'<line x1="0" y1="{y_hi}" x2="{dim_x}" y2="{y_hi}" '
@@ -3256,7 +3300,7 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
             'stroke="#000" stroke-width="0.5"/>\n'
         )
         arrow = 1.5
-        svg += (
+        write(
             f'<polygon points="{dim_x},{y_lo} {dim_x - arrow},{y_lo - arrow} '
             f'{dim_x + arrow},{y_lo - arrow}" fill="#000"/>\n'
             f'<polygon points="{dim_x},{y_hi} {dim_x - arrow},{y_hi + arrow} '
@@ -3264,14 +3308,15 @@ def _render_pillar_view(house_config: dict, view_type: str, pillars_to_show: lis
         )
         mid_y = (y_lo + y_hi) / 2
         text_x = dim_x - 4
-        svg += (
+        write(
             f'<text x="{text_x}" y="{mid_y}" text-anchor="middle" '
             f'font-size="4" fill="#000" '
             f'transform="rotate(-90 {text_x} {mid_y})">'
             f'{format_dimension(z_hi - z_lo)}</text>\n'
         )
 
-    svg += '</g>\n</svg>\n'
+    write('</g>\n</svg>\n')
+    svg = buf.getvalue()
 
     if output_path:
         with open(output_path, 'w') as f:
@@ -3393,18 +3438,7 @@ def generate_all_pillar_elevations(house_config: dict, output_dir: str = None):
       - pillar_section_row_<b/c/d>.svg  (Y-axis sections, viewed from front)
       - pillar_section_col_<2/3/4>.svg  (X-axis sections, viewed from left)
     """
-    import os
-
-    if output_dir is None:
-        try:
-            import bpy
-            blend_filepath = bpy.data.filepath
-            blend_dir = os.path.dirname(blend_filepath) if blend_filepath else os.getcwd()
-        except ImportError:
-            blend_dir = os.getcwd()
-        output_dir = os.path.join(blend_dir, "docs")
-
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = _resolve_output_dir(output_dir)
 
     print("\n" + "=" * 70)
     print("GENERATING PILLAR ELEVATION & SECTION VIEWS (SVG)")
@@ -3449,27 +3483,10 @@ def generate_all_floor_plans(house_config: dict, output_dir: str = None):
         house_config: Complete house configuration
         output_dir: Directory to save SVG files (defaults to docs folder for web deployment)
     """
-    import os
     from house_expand import expand_room_walls
     house_config = expand_room_walls(house_config)
 
-    if output_dir is None:
-        # Get the blend file directory (if running in Blender) or use current directory
-        try:
-            import bpy
-            blend_filepath = bpy.data.filepath
-            if blend_filepath:
-                blend_dir = os.path.dirname(blend_filepath)
-            else:
-                blend_dir = os.getcwd()
-        except ImportError:
-            # Not running in Blender, use current directory
-            blend_dir = os.getcwd()
-
-        # Save to docs folder for web deployment
-        output_dir = os.path.join(blend_dir, "docs")
-
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = _resolve_output_dir(output_dir)
 
     print("\n" + "="*70)
     print("GENERATING FLOOR PLANS (SVG)")
@@ -3712,20 +3729,8 @@ def setup_web_viewer(docs_dir: str = None):
     Usage:
         setup_web_viewer()  # Creates docs/ folder with static files
     """
-    import os
-
-    if docs_dir is None:
-        # Get the blend file directory
-        blend_filepath = bpy.data.filepath
-        if blend_filepath:
-            blend_dir = os.path.dirname(blend_filepath)
-        else:
-            blend_dir = os.getcwd()
-
-        docs_dir = os.path.join(blend_dir, "docs")
-
-    # Create docs directory
-    os.makedirs(docs_dir, exist_ok=True)
+    # Resolve (and create) the docs directory
+    docs_dir = _resolve_output_dir(docs_dir)
 
     print("\n" + "="*70)
     print("SETTING UP WEB VIEWER")
@@ -3756,7 +3761,22 @@ def setup_web_viewer(docs_dir: str = None):
 # COMBINED VIEW GENERATION
 # ============================================================================
 
-def generate_combined_floor_plans(house_config: dict, output_dir: str = None) -> str:
+# Rectangular object types that set a floor's content bounds (walls are
+# bounded by their endpoints)
+_BOUNDS_RECT_TYPES = frozenset({'floor_slab', 'beam', 'room'})
+
+# Per-drawing wrappers on the combined sheets: an id'd group holding the
+# placed drawing, closed off by its label (bound .format, filled per drawing)
+_COMBINED_DRAWING_OPEN = '<g id="{}">\n<g transform="translate({}, {})">\n'.format
+_COMBINED_DRAWING_CLOSE = (
+    '</g>\n'
+    '<text x="{}" y="{}" text-anchor="middle" class="{}">{}</text>\n'
+    '</g>\n'
+).format
+
+
+def generate_combined_floor_plans(house_config: dict, output_dir: str = None,
+                                  compress: bool = False) -> str:
     """
     Generate a single combined SVG showing all floor plans side-by-side.
     Uses consistent scaling across all floors for direct comparison.
@@ -3764,27 +3784,15 @@ def generate_combined_floor_plans(house_config: dict, output_dir: str = None) ->
     Args:
         house_config: Complete house configuration
         output_dir: Directory to save the combined SVG
+        compress: Write a gzip-compressed .svgz instead of a plain .svg
         
     Returns:
         Path to the generated combined SVG file
     """
-    import os
     from house_expand import expand_room_walls
     house_config = expand_room_walls(house_config)
 
-    if output_dir is None:
-        try:
-            import bpy
-            blend_filepath = bpy.data.filepath
-            if blend_filepath:
-                blend_dir = os.path.dirname(blend_filepath)
-            else:
-                blend_dir = os.getcwd()
-        except ImportError:
-            blend_dir = os.getcwd()
-        output_dir = os.path.join(blend_dir, "docs")
-    
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = _resolve_output_dir(output_dir)
     
     print("\nGenerating combined floor plans...")
     
@@ -3805,94 +3813,50 @@ def generate_combined_floor_plans(house_config: dict, output_dir: str = None) ->
         floor_num = floor_config['floor_number']
         floor_name = floor_config['name']
 
-        # Generate the floor plan SVG content (pass None for output_path to get string only)
-        from io import StringIO
-        import sys
-
-        # Temporarily capture print output
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        # IMPORTANT: generate_floor_plan_svg takes floor_config (not house_config)
-        svg_content = generate_floor_plan_svg(floor_config, output_path=None, scale=scale)
-
-        # Restore stdout
-        sys.stdout = old_stdout
+        # Render the floor plan directly; the renderer reports where its
+        # drawing group sits, so nothing has to be parsed back out
+        svg_content, drawing = _render_floor_plan(floor_config, scale=scale)
 
-        # Extract the entire content group WITH its transform
-        import re
-        # Find the opening transform tag and extract transform values
-        transform_pattern = r'<g transform="translate\(([0-9.]+),\s*([0-9.]+)\)\s*scale\([^)]+\)">'
-        transform_match = re.search(transform_pattern, svg_content)
-
-        if not transform_match:
-            print(f"Warning: Could not find transform tag for {floor_name}")
+        if drawing is None:
+            print(f"Warning: Nothing to draw for {floor_name}")
             continue
 
-        translate_x = float(transform_match.group(1))
-        translate_y = float(transform_match.group(2))
-        start_pos = transform_match.end()
-
-        # Find the MATCHING closing </g> tag by counting nested tags
-        depth = 1
-        pos = start_pos
-        while depth > 0 and pos < len(svg_content):
-            next_open = svg_content.find('<g ', pos)
-            next_close = svg_content.find('</g>', pos)
-
-            if next_close == -1:
-                break
-
-            if next_open != -1 and next_open < next_close:
-                depth += 1
-                pos = next_open + 3
-            else:
-                depth -= 1
-                if depth == 0:
-                    content_only = svg_content[start_pos:next_close]
-                    break
-                pos = next_close + 4
-
-        if depth != 0:
-            print(f"Warning: Could not find matching closing tag for {floor_name}")
-            continue
+        translate_x = float(drawing['translate_x'])
+        translate_y = float(drawing['translate_y'])
+        content_only = svg_content[drawing['content_start']:drawing['content_end']]
 
         # Reconstruct with the transform
-        drawing_content_with_transform = f'<g transform="translate({translate_x}, {translate_y}) scale(2.0, 2.0)">\n{content_only}\n</g>'
-
-        # Extract SVG dimensions and scale from transform
-        svg_match = re.search(r'<svg[^>]+width="([0-9.]+)"[^>]+height="([0-9.]+)"', svg_content)
-        scale_match = re.search(r'scale\(([0-9.]+)', drawing_content_with_transform)
+        drawing_content_with_transform = f'<g transform="translate({translate_x}, {translate_y}) scale({scale}, {scale})">\n{content_only}\n</g>'
 
-        if svg_match:
-            svg_width = float(svg_match.group(1))
-            svg_height = float(svg_match.group(2))
-        else:
-            svg_width = 1000
-            svg_height = 1000
-
-        if scale_match:
-            content_scale = float(scale_match.group(1))
-        else:
-            content_scale = scale  # use the scale we passed in
+        svg_width = float(drawing['svg_width'])
+        svg_height = float(drawing['svg_height'])
+        content_scale = scale
 
-        # Calculate actual content bounds
+        # Calculate actual content bounds: gather the edge coordinates in
+        # one pass and reduce each list once
         if 'objects' in floor_config:
-            min_x, min_y = float('inf'), float('inf')
-            max_x, max_y = float('-inf'), float('-inf')
+            low_xs, high_xs, low_ys, high_ys = [], [], [], []
 
             for obj in floor_config['objects']:
                 obj_type = obj.get('type')
-                if obj_type in ['floor_slab', 'beam', 'room']:
+                if obj_type in _BOUNDS_RECT_TYPES:
                     x, y = obj['x'], obj['y']
-                    w, l = obj['width'], obj['length']
-                    min_x, min_y = min(min_x, x), min(min_y, y)
-                    max_x, max_y = max(max_x, x + w), max(max_y, y + l)
+                    low_xs.append(x)
+                    high_xs.append(x + obj['width'])
+                    low_ys.append(y)
+                    high_ys.append(y + obj['length'])
                 elif obj_type == 'wall':
-                    min_x = min(min_x, obj['start_x'], obj['end_x'])
-                    max_x = max(max_x, obj['start_x'], obj['end_x'])
-                    min_y = min(min_y, obj['start_y'], obj['end_y'])
-                    max_y = max(max_y, obj['start_y'], obj['end_y'])
+                    wall_xs = (obj['start_x'], obj['end_x'])
+                    wall_ys = (obj['start_y'], obj['end_y'])
+                    low_xs.extend(wall_xs)
+                    high_xs.extend(wall_xs)
+                    low_ys.extend(wall_ys)
+                    high_ys.extend(wall_ys)
+
+            min_x = min(low_xs, default=float('inf'))
+            min_y = min(low_ys, default=float('inf'))
+            max_x = max(high_xs, default=float('-inf'))
+            max_y = max(high_ys, default=float('-inf'))
 
             # Visual dimensions = content_size * scale (without translate offset)
             content_width = (max_x - min_x) * content_scale
@@ -3925,8 +3889,12 @@ def generate_combined_floor_plans(house_config: dict, output_dir: str = None) ->
     # Canvas height needs to accommodate: title + top margin + tallest content + label offset + bottom margin
     canvas_height = title_space + top_margin + max_height + label_offset + bottom_margin
 
-    # Start building the combined SVG
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+    # Stream the combined SVG straight to its file
+    filename = 'floor_plans_combined.svgz' if compress else 'floor_plans_combined.svg'
+    output_path = os.path.join(output_dir, filename)
+    with _open_svg_output(output_path, compress) as f:
+        write = f.write
+        write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"
      width="{canvas_width}" height="{canvas_height}" viewBox="0 0 {canvas_width} {canvas_height}">
 <title>All Floor Plans</title>
@@ -3936,49 +3904,42 @@ def generate_combined_floor_plans(house_config: dict, output_dir: str = None) ->
         .floor-label {{ font-size: 16px; font-weight: bold; fill: #333; }}
     </style>
 </defs>
-'''
+''')
 
-    # Add main title
-    title_y = title_space - 10
-    svg += f'<text x="{canvas_width/2}" y="{title_y}" text-anchor="middle" font-size="20" font-weight="bold" fill="#333">All Floor Plans</text>\n'
+        # Add main title
+        title_y = title_space - 10
+        write(f'<text x="{canvas_width/2}" y="{title_y}" text-anchor="middle" font-size="20" font-weight="bold" fill="#333">All Floor Plans</text>\n')
 
-    # Calculate consistent label Y position (same for all floors)
-    label_y = title_space + top_margin + max_height + label_offset
+        # Calculate consistent label Y position (same for all floors)
+        label_y = title_space + top_margin + max_height + label_offset
 
-    # Add each floor plan
-    current_x = left_right_margin
-    content_start_y = title_space + top_margin
-    for floor in floor_data:
-        canvas_width = floor['canvas_width']
-        translate_x = floor['translate_x']
-        content_width = floor['content_width']
+        # Add each floor plan
+        current_x = left_right_margin
+        content_start_y = title_space + top_margin
+        for floor in floor_data:
+            canvas_width = floor['canvas_width']
+            translate_x = floor['translate_x']
+            content_width = floor['content_width']
 
-        # Add the floor content (includes its own transform)
-        svg += f'<g id="floor_{floor["number"]}">\n'
-        svg += f'<g transform="translate({current_x}, {content_start_y})">\n'
-        svg += floor['content']
-        svg += '</g>\n'
+            # Add the floor content (includes its own transform)
+            write(_COMBINED_DRAWING_OPEN(f'floor_{floor["number"]}', current_x, content_start_y))
+            write(floor['content'])
 
-        # Add floor label - centered on visual content (actual building)
-        # All labels at same Y position (bottom of canvas)
-        label_x = current_x + translate_x + content_width / 2
-        svg += f'<text x="{label_x}" y="{label_y}" text-anchor="middle" class="floor-label">{floor["name"]}</text>\n'
-        svg += '</g>\n'
+            # Add floor label - centered on visual content (actual building)
+            # All labels at same Y position (bottom of canvas)
+            label_x = current_x + translate_x + content_width / 2
+            write(_COMBINED_DRAWING_CLOSE(label_x, label_y, 'floor-label', floor['name']))
 
-        current_x += canvas_width + spacing
+            current_x += canvas_width + spacing
 
-    svg += '</svg>'
-    
-    # Save the combined SVG
-    output_path = os.path.join(output_dir, 'floor_plans_combined.svg')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(svg)
+        write('</svg>')
     
     print(f"✓ Combined floor plans saved to: {output_path}")
     return output_path
 
 
-def generate_combined_elevations(house_config: dict, output_dir: str = None) -> str:
+def generate_combined_elevations(house_config: dict, output_dir: str = None,
+                                 compress: bool = False) -> str:
     """
     Generate a single combined SVG showing all elevation views side-by-side.
     Views are in standard architectural order: left, front, right, back.
@@ -3987,27 +3948,15 @@ def generate_combined_elevations(house_config: dict, output_dir: str = None) ->
     Args:
         house_config: Complete house configuration
         output_dir: Directory to save the combined SVG
+        compress: Write a gzip-compressed .svgz instead of a plain .svg
         
     Returns:
         Path to the generated combined SVG file
     """
-    import os
     from house_expand import expand_room_walls
     house_config = expand_room_walls(house_config)
 
-    if output_dir is None:
-        try:
-            import bpy
-            blend_filepath = bpy.data.filepath
-            if blend_filepath:
-                blend_dir = os.path.dirname(blend_filepath)
-            else:
-                blend_dir = os.getcwd()
-        except ImportError:
-            blend_dir = os.getcwd()
-        output_dir = os.path.join(blend_dir, "docs")
-    
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = _resolve_output_dir(output_dir)
     
     print("\nGenerating combined elevations...")
     
@@ -4031,74 +3980,20 @@ def generate_combined_elevations(house_config: dict, output_dir: str = None) ->
     # Generate content for each elevation
     elevation_data = []
     for view_type, view_label in views:
-        from io import StringIO
-        import sys
-
-        # Temporarily capture print output
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        svg_content = generate_elevation_view(house_config, view_type, scale=scale)
+        # Render the elevation directly; the renderer reports where its
+        # drawing group sits, so nothing has to be parsed back out
+        svg_content, drawing = _render_elevation_view(house_config, view_type, scale=scale)
 
-        # Restore stdout
-        sys.stdout = old_stdout
-
-        # Extract the entire content group WITH its transform
-        import re
-        # Find the opening transform tag and extract transform values
-        transform_pattern = r'<g transform="translate\(([0-9.]+),\s*([0-9.]+)\)\s*scale\([^)]+\)">'
-        transform_match = re.search(transform_pattern, svg_content)
-
-        if not transform_match:
-            print(f"Warning: Could not find transform tag for {view_label}")
-            continue
-
-        translate_x = float(transform_match.group(1))
-        translate_y = float(transform_match.group(2))
-        start_pos = transform_match.end()
-
-        # Find the MATCHING closing </g> tag by counting nested tags
-        depth = 1
-        pos = start_pos
-        while depth > 0 and pos < len(svg_content):
-            next_open = svg_content.find('<g ', pos)
-            next_close = svg_content.find('</g>', pos)
-
-            if next_close == -1:
-                break
-
-            if next_open != -1 and next_open < next_close:
-                depth += 1
-                pos = next_open + 3
-            else:
-                depth -= 1
-                if depth == 0:
-                    content_only = svg_content[start_pos:next_close]
-                    break
-                pos = next_close + 4
-
-        if depth != 0:
-            print(f"Warning: Could not find matching closing tag for {view_label}")
-            continue
+        translate_x = float(drawing['translate_x'])
+        translate_y = float(drawing['translate_y'])
+        content_only = svg_content[drawing['content_start']:drawing['content_end']]
 
         # Reconstruct with the transform
-        drawing_content_with_transform = f'<g transform="translate({translate_x}, {translate_y}) scale(2.0, 2.0)">\n{content_only}\n</g>'
-
-        # Extract SVG dimensions and scale from transform
-        svg_match = re.search(r'<svg[^>]+width="([0-9.]+)"[^>]+height="([0-9.]+)"', svg_content)
-        scale_match = re.search(r'scale\(([0-9.]+)', drawing_content_with_transform)
+        drawing_content_with_transform = f'<g transform="translate({translate_x}, {translate_y}) scale({scale}, {scale})">\n{content_only}\n</g>'
 
-        if svg_match:
-            svg_width = float(svg_match.group(1))
-            svg_height = float(svg_match.group(2))
-        else:
-            svg_width = 1000
-            svg_height = 800
-
-        if scale_match:
-            content_scale = float(scale_match.group(1))
-        else:
-            content_scale = scale  # use the scale we passed in
+        svg_width = float(drawing['svg_width'])
+        svg_height = float(drawing['svg_height'])
+        content_scale = scale
 
         # Calculate actual visual dimensions for elevations
         plinth = house_config.get('plinth', {})
@@ -4135,8 +4030,12 @@ def generate_combined_elevations(house_config: dict, output_dir: str = None) ->
     # Canvas height needs to accommodate: title + top margin + tallest content + label offset + bottom margin
     canvas_height = title_space + top_margin + max_height + label_offset + bottom_margin
 
-    # Start building the combined SVG
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+    # Stream the combined SVG straight to its file
+    filename = 'elevations_combined.svgz' if compress else 'elevations_combined.svg'
+    output_path = os.path.join(output_dir, filename)
+    with _open_svg_output(output_path, compress) as f:
+        write = f.write
+        write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"
      width="{canvas_width}" height="{canvas_height}" viewBox="0 0 {canvas_width} {canvas_height}">
 <title>All Elevations</title>
@@ -4146,43 +4045,33 @@ def generate_combined_elevations(house_config: dict, output_dir: str = None) ->
         .view-label {{ font-size: 16px; font-weight: bold; fill: #333; }}
     </style>
 </defs>
-'''
+''')
 
-    # Add main title
-    title_y = title_space - 10
-    svg += f'<text x="{canvas_width/2}" y="{title_y}" text-anchor="middle" font-size="20" font-weight="bold" fill="#333">All Elevations</text>\n'
+        # Add main title
+        title_y = title_space - 10
+        write(f'<text x="{canvas_width/2}" y="{title_y}" text-anchor="middle" font-size="20" font-weight="bold" fill="#333">All Elevations</text>\n')
 
-    # Calculate consistent label Y position (same for all elevations)
-    label_y = title_space + top_margin + max_height + label_offset
+        # Calculate consistent label Y position (same for all elevations)
+        label_y = title_space + top_margin + max_height + label_offset
 
-    # Add each elevation
-    current_x = left_right_margin
-    content_start_y = title_space + top_margin
-    for elev in elevation_data:
-        canvas_width = elev['canvas_width']
-        translate_x = elev['translate_x']
-        content_width = elev['content_width']
+        # Add each elevation
+        current_x = left_right_margin
+        content_start_y = title_space + top_margin
+        for elev in elevation_data:
+            canvas_width = elev['canvas_width']
 
-        # Add the elevation content (includes its own transform)
-        svg += f'<g id="elevation_{elev["view"]}">\n'
-        svg += f'<g transform="translate({current_x}, {content_start_y})">\n'
-        svg += elev['content']
-        svg += '</g>\n'
+            # Add the elevation content (includes its own transform)
+            write(_COMBINED_DRAWING_OPEN(f'elevation_{elev["view"]}', current_x, content_start_y))
+            write(elev['content'])
 
-        # Add view label - centered on canvas (entire drawing viewport)
-        # All labels at same Y position (bottom of canvas)
-        label_x = current_x + canvas_width / 2
-        svg += f'<text x="{label_x}" y="{label_y}" text-anchor="middle" class="view-label">{elev["label"]}</text>\n'
-        svg += '</g>\n'
+            # Add view label - centered on canvas (entire drawing viewport)
+            # All labels at same Y position (bottom of canvas)
+            label_x = current_x + canvas_width / 2
+            write(_COMBINED_DRAWING_CLOSE(label_x, label_y, 'view-label', elev['label']))
 
-        current_x += canvas_width + spacing
+            current_x += canvas_width + spacing
 
-    svg += '</svg>'
-    
-    # Save the combined SVG
-    output_path = os.path.join(output_dir, 'elevations_combined.svg')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(svg)
+        write('</svg>')
 
     print(f"✓ Combined elevations saved to: {output_path}")
     return output_path
@@ -4196,22 +4085,10 @@ def generate_roof_sections_svg(house_config: dict, output_dir: str = None) -> st
 
     Writes docs/roof_plan.svg. Currently supports hip_roof only.
     """
-    import math
-    import os
     from house_expand import expand_room_walls
     house_config = expand_room_walls(house_config)
 
-    if output_dir is None:
-        try:
-            import bpy
-            blend_filepath = bpy.data.filepath
-            if blend_filepath:
-                output_dir = os.path.join(os.path.dirname(blend_filepath), 'docs')
-            else:
-                output_dir = 'docs'
-        except ImportError:
-            output_dir = 'docs'
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = _resolve_output_dir(output_dir)
 
     roof = None
     for floor in house_config.get('floors', []):
@@ -8534,10 +8411,9 @@ def generate_roof_sections_svg(house_config: dict, output_dir: str = None) -> st
     try:
         with open(external_eave_svg_path, 'r', encoding='utf-8') as _ef:
             _external = _ef.read()
-        import re as _re
-        _m = _re.search(r'<svg\b[^>]*>(.*)</svg>', _external, flags=_re.DOTALL)
+        _m = re.search(r'<svg\b[^>]*>(.*)</svg>', _external, flags=re.DOTALL)
         _inner = _m.group(1) if _m else ''
-        _vb = _re.search(r'viewBox\s*=\s*"([^"]+)"', _external)
+        _vb = re.search(r'viewBox\s*=\s*"([^"]+)"', _external)
         _view_box = _vb.group(1) if _vb else '0 0 297 210'
         _title_bar = 40
         _eave_frag += (f'<svg x="{outer_pad}" y="{eave_y0 + _title_bar}" '
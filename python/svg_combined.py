@@ -7,20 +7,36 @@ import os
 import re
 from xml.etree import ElementTree as ET
 
-
-def create_combined_floor_plans(output_dir: str = "docs"):
+# Individual sheet file names, e.g. floor_plan_1_Ground_Floor.svg
+_FLOOR_PLAN_FILE_RE = re.compile(r'floor_plan_(\w+)\.svg')
+# Drawing scale from the content group's transform. Floor plans use a
+# uniform scale; elevations may carry a negative Y scale.
+_FLOOR_SCALE_RE = re.compile(r'scale\(([0-9.]+)(?:,\s*([0-9.]+))?\)')
+_ELEVATION_SCALE_RE = re.compile(r'scale\(([0-9.]+)(?:,\s*([0-9.-]+))?\)')
+# A sheet's drawing group content, up to the group's closing tag (the one
+# followed by the sheet's title <text>)
+_GROUP_CONTENT_RE = re.compile(r'<g transform="[^"]+">(.+?)</g>\s*<text', re.DOTALL)
+
+
+def _group_content(content: str):
     """
-    Create a combined SVG showing all floor plans arranged horizontally.
+    Return the inner content of a sheet's drawing group, or None if the
+    sheet has no such group.
+    """
+    match = _GROUP_CONTENT_RE.search(content)
+    return match.group(1) if match else None
 
-    Args:
-        output_dir: Directory containing individual floor plan SVGs
+
+def _load_floor_plans(output_dir: str) -> list:
+    """
+    Read the individual floor plan SVGs saved in output_dir, in file name
+    order, with their size, scale and drawing-group content.
     """
     # Find all floor plan SVGs in the directory
-    floor_pattern = re.compile(r'floor_plan_(\w+)\.svg')
     floor_files = []
 
     for filename in sorted(os.listdir(output_dir)):
-        match = floor_pattern.match(filename)
+        match = _FLOOR_PLAN_FILE_RE.match(filename)
         if not match:
             continue
 
@@ -37,19 +53,30 @@ def create_combined_floor_plans(output_dir: str = "docs"):
 
         # Extract the original scale from the g transform attribute
         # Format: <g transform="translate(x, y) scale(sx, sy)">
-        import re as regex_module
-        scale_match = regex_module.search(r'scale\(([0-9.]+)(?:,\s*([0-9.]+))?\)', svg_content)
+        scale_match = _FLOOR_SCALE_RE.search(svg_content)
         original_scale = float(scale_match.group(1)) if scale_match else 1.0
 
         floor_files.append({
             'name': floor_name,
             'filename': filename,
-            'content': svg_content,
+            'content': _group_content(svg_content),
             'width': width,
             'height': height,
             'original_scale': original_scale
         })
 
+    return floor_files
+
+
+def create_combined_floor_plans(output_dir: str = "docs"):
+    """
+    Create a combined SVG showing all floor plans arranged horizontally.
+
+    Args:
+        output_dir: Directory containing individual floor plan SVGs
+    """
+    floor_files = _load_floor_plans(output_dir)
+
     if not floor_files:
         print("No floor plans found to combine")
         return
@@ -63,16 +90,18 @@ def create_combined_floor_plans(output_dir: str = "docs"):
     # We want all floors to use the same scale so 1 world unit = same screen size
     target_scale = 0.25  # Target screen scale
 
-    # Calculate dimensions using the target scale
-    # Each floor's screen size = (width/original_scale) * target_scale
-    def get_screen_width(f):
-        return (f['width'] / f['original_scale']) * target_scale
-
-    def get_screen_height(f):
-        return (f['height'] / f['original_scale']) * target_scale
+    # Calculate dimensions using the target scale, once per floor:
+    # (floor scale, screen width, screen height), where each floor's
+    # screen size = (width/original_scale) * target_scale
+    screen_sizes = [
+        (target_scale / f['original_scale'],
+         (f['width'] / f['original_scale']) * target_scale,
+         (f['height'] / f['original_scale']) * target_scale)
+        for f in floor_files
+    ]
 
-    total_width = sum(get_screen_width(f) for f in floor_files) + spacing * (len(floor_files) - 1)
-    max_height = max(get_screen_height(f) for f in floor_files)
+    total_width = sum(size[1] for size in screen_sizes) + spacing * (len(floor_files) - 1)
+    max_height = max(size[2] for size in screen_sizes)
 
     # Add margins
     margin = 50  # Reduced margin
@@ -80,8 +109,11 @@ def create_combined_floor_plans(output_dir: str = "docs"):
     canvas_width = total_width + 2 * margin
     canvas_height = max_height + 2 * margin + title_space
 
-    # Create combined SVG
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+    # Stream the combined SVG straight to its file
+    output_path = os.path.join(output_dir, 'floor_plans_combined.svg')
+    with open(output_path, 'w', encoding='utf-8') as f:
+        write = f.write
+        write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"
      width="{canvas_width}" height="{canvas_height}" viewBox="0 0 {canvas_width} {canvas_height}">
 <title>All Floor Plans</title>
@@ -91,61 +123,44 @@ def create_combined_floor_plans(output_dir: str = "docs"):
         .floor-label {{ font-size: 14px; font-weight: bold; fill: #333; }}
     </style>
 </defs>
-'''
-
-    # Add title
-    title_y = title_space / 2 + 10
-    svg += f'<text x="{canvas_width/2}" y="{title_y}" text-anchor="middle" font-size="20" font-weight="bold" fill="#333">All Floor Plans</text>\n'
-
-    # Add each floor plan
-    current_x = margin
-    for floor_data in floor_files:
-        # Calculate this floor's scale to match the target scale
-        original_scale = floor_data['original_scale']
-        floor_scale = target_scale / original_scale
+''')
 
-        floor_width = get_screen_width(floor_data)
-        floor_height = get_screen_height(floor_data)
+        # Add title
+        title_y = title_space / 2 + 10
+        write(f'<text x="{canvas_width/2}" y="{title_y}" text-anchor="middle" font-size="20" font-weight="bold" fill="#333">All Floor Plans</text>\n')
 
-        # Extract the content from the original SVG
-        content = floor_data['content']
+        # Add each floor plan
+        current_x = margin
+        for floor_data, (floor_scale, floor_width, floor_height) in zip(floor_files, screen_sizes):
+            # The content of the original drawing group
+            content = floor_data['content']
 
-        # Create a group for this floor with transformation
-        # Use floor_scale which normalizes all floors to the same world scale
-        svg += f'<g transform="translate({current_x}, {margin + title_space}) scale({floor_scale})">\n'
+            # Create a group for this floor with transformation
+            # Use floor_scale which normalizes all floors to the same world scale
+            write(f'<g transform="translate({current_x}, {margin + title_space}) scale({floor_scale})">\n')
 
-        # Extract and include the main content (skip the outer svg tag)
-        # The pattern matches: <g transform="translate(...) scale(...)">content</g>
-        g_match = re.search(r'<g transform="[^"]+">(.+?)</g>\s*<text', content, re.DOTALL)
-        if g_match:
-            svg += g_match.group(1)
+            # Include the main content (the inside of the sheet's drawing group)
+            if content is not None:
+                write(content)
 
-        svg += '</g>\n'
+            write('</g>\n')
 
-        # Add floor label below
-        label_y = margin + title_space + floor_height + 30
-        svg += f'<text x="{current_x + floor_width/2}" y="{label_y}" text-anchor="middle" class="floor-label">{floor_data["name"]}</text>\n'
+            # Add floor label below
+            label_y = margin + title_space + floor_height + 30
+            write(f'<text x="{current_x + floor_width/2}" y="{label_y}" text-anchor="middle" class="floor-label">{floor_data["name"]}</text>\n')
 
-        current_x += floor_width + spacing
+            current_x += floor_width + spacing
 
-    svg += '</svg>'
-
-    # Save combined SVG
-    output_path = os.path.join(output_dir, 'floor_plans_combined.svg')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(svg)
+        write('</svg>')
 
     print(f"✓ Combined floor plans saved to: {output_path}")
     return output_path
 
 
-def create_combined_elevations(output_dir: str = "docs"):
+def _load_elevations(output_dir: str) -> list:
     """
-    Create a combined SVG showing all elevation views (left, front, right, back)
-    arranged horizontally with bottoms aligned.
-
-    Args:
-        output_dir: Directory containing individual elevation SVGs
+    Read the individual elevation SVGs saved in output_dir, in standard
+    architectural order, with their size, scale and drawing-group content.
     """
     # Order: left, front, right, back (standard architectural layout)
     view_order = ['left', 'front', 'right', 'back']
@@ -174,19 +189,31 @@ def create_combined_elevations(output_dir: str = "docs"):
         height = float(root.get('height', 800))
 
         # Extract the original scale from the g transform attribute
-        import re as regex_module
-        scale_match = regex_module.search(r'scale\(([0-9.]+)(?:,\s*([0-9.-]+))?\)', svg_content)
+        scale_match = _ELEVATION_SCALE_RE.search(svg_content)
         original_scale = abs(float(scale_match.group(1))) if scale_match else 1.0
 
         elevation_svgs.append({
             'view_type': view_type,
             'label': view_labels[view_type],
-            'content': svg_content,
+            'content': _group_content(svg_content),
             'width': width,
             'height': height,
             'original_scale': original_scale
         })
 
+    return elevation_svgs
+
+
+def create_combined_elevations(output_dir: str = "docs"):
+    """
+    Create a combined SVG showing all elevation views (left, front, right, back)
+    arranged horizontally with bottoms aligned.
+
+    Args:
+        output_dir: Directory containing individual elevation SVGs
+    """
+    elevation_svgs = _load_elevations(output_dir)
+
     if not elevation_svgs:
         print("No elevations found to combine")
         return
@@ -199,15 +226,17 @@ def create_combined_elevations(output_dir: str = "docs"):
     # Use a target scale that will be consistent across all elevations
     target_scale = 0.25  # Target screen scale
 
-    # Calculate dimensions using the target scale
-    def get_screen_width(e):
-        return (e['width'] / e['original_scale']) * target_scale
-
-    def get_screen_height(e):
-        return (e['height'] / e['original_scale']) * target_scale
+    # Calculate dimensions using the target scale, once per elevation:
+    # (elevation scale, screen width, screen height)
+    screen_sizes = [
+        (target_scale / e['original_scale'],
+         (e['width'] / e['original_scale']) * target_scale,
+         (e['height'] / e['original_scale']) * target_scale)
+        for e in elevation_svgs
+    ]
 
-    total_width = sum(get_screen_width(e) for e in elevation_svgs) + spacing * (len(elevation_svgs) - 1)
-    max_height = max(get_screen_height(e) for e in elevation_svgs)
+    total_width = sum(size[1] for size in screen_sizes) + spacing * (len(elevation_svgs) - 1)
+    max_height = max(size[2] for size in screen_sizes)
 
     # Add margins
     margin = 50  # Reduced margin
@@ -215,8 +244,11 @@ def create_combined_elevations(output_dir: str = "docs"):
     canvas_width = total_width + 2 * margin
     canvas_height = max_height + 2 * margin + title_space
 
-    # Create combined SVG
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+    # Stream the combined SVG straight to its file
+    output_path = os.path.join(output_dir, 'elevations_combined.svg')
+    with open(output_path, 'w', encoding='utf-8') as f:
+        write = f.write
+        write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"
      width="{canvas_width}" height="{canvas_height}" viewBox="0 0 {canvas_width} {canvas_height}">
 <title>All Elevations</title>
@@ -226,50 +258,36 @@ def create_combined_elevations(output_dir: str = "docs"):
         .view-label {{ font-size: 14px; font-weight: bold; fill: #333; }}
     </style>
 </defs>
-'''
-
-    # Add title
-    title_y = title_space / 2 + 10
-    svg += f'<text x="{canvas_width/2}" y="{title_y}" text-anchor="middle" font-size="20" font-weight="bold" fill="#333">All Elevations</text>\n'
-
-    # Add each elevation
-    current_x = margin
-    for elev_data in elevation_svgs:
-        # Calculate this elevation's scale to match the target scale
-        original_scale = elev_data['original_scale']
-        elev_scale = target_scale / original_scale
+''')
 
-        elev_width = get_screen_width(elev_data)
-        elev_height = get_screen_height(elev_data)
+        # Add title
+        title_y = title_space / 2 + 10
+        write(f'<text x="{canvas_width/2}" y="{title_y}" text-anchor="middle" font-size="20" font-weight="bold" fill="#333">All Elevations</text>\n')
 
-        # Extract the content from the original SVG
-        content = elev_data['content']
+        # Add each elevation
+        current_x = margin
+        for elev_data, (elev_scale, elev_width, elev_height) in zip(elevation_svgs, screen_sizes):
+            # The content of the original drawing group
+            content = elev_data['content']
 
-        # Create a group for this elevation with transformation
-        # Align bottoms: place at same Y position
-        # Use negative Y-scale to match the original elevation SVGs (which use scale(2.0, -2.0))
-        svg += f'<g transform="translate({current_x}, {margin + title_space + elev_height}) scale({elev_scale}, {-elev_scale})">\n'
+            # Create a group for this elevation with transformation
+            # Align bottoms: place at same Y position
+            # Use negative Y-scale to match the original elevation SVGs (which use scale(2.0, -2.0))
+            write(f'<g transform="translate({current_x}, {margin + title_space + elev_height}) scale({elev_scale}, {-elev_scale})">\n')
 
-        # Extract and include the main content (skip the outer svg tag)
-        # The pattern matches: <g transform="translate(...) scale(...)">content</g>
-        g_match = re.search(r'<g transform="[^"]+">(.+?)</g>\s*<text', content, re.DOTALL)
-        if g_match:
-            svg += g_match.group(1)
+            # Include the main content (the inside of the sheet's drawing group)
+            if content is not None:
+                write(content)
 
-        svg += '</g>\n'
+            write('</g>\n')
 
-        # Add view label below
-        label_y = margin + title_space + elev_height + 30
-        svg += f'<text x="{current_x + elev_width/2}" y="{label_y}" text-anchor="middle" class="view-label">{elev_data["label"]}</text>\n'
+            # Add view label below
+            label_y = margin + title_space + elev_height + 30
+            write(f'<text x="{current_x + elev_width/2}" y="{label_y}" text-anchor="middle" class="view-label">{elev_data["label"]}</text>\n')
 
-        current_x += elev_width + spacing
+            current_x += elev_width + spacing
 
-    svg += '</svg>'
-
-    # Save combined SVG
-    output_path = os.path.join(output_dir, 'elevations_combined.svg')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(svg)
+        write('</svg>')
 
     print(f"✓ Combined elevations saved to: {output_path}")
     return output_path